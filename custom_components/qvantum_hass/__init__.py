@@ -485,6 +485,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         if entry.runtime_data:
+            # Flush queued setting writes while the API session is still open
+            for coordinator in entry.runtime_data["coordinators"].values():
+                await coordinator.async_shutdown()
             await entry.runtime_data["api"].close()
 
     return unload_ok
@@ -46,6 +46,23 @@ _LOGGER = logging.getLogger(__name__)
 REQUEST_TIMEOUT = 30
 
 
+def _coerce_setting_value(value: Any) -> Any:
+    """Convert an integer string to int before it is sent to the device.
+
+    Args:
+        value: Value to write
+
+    Returns:
+        The int for strings such as "5" or "-2"; any other value unchanged.
+    """
+    if isinstance(value, str) and value.lstrip("-").isdigit():
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return value
+
+
 class QvantumApiError(Exception):
     """Base exception for Qvantum API errors."""
 
@@ -620,12 +637,7 @@ class QvantumApi:
         """
         _LOGGER.debug("Setting %s to %s for device %s", setting, value, device_id)
 
-        # Try to convert to int if possible
-        try:
-            if isinstance(value, str) and value.lstrip("-").isdigit():
-                value = int(value)
-        except (ValueError, AttributeError):
-            pass
+        value = _coerce_setting_value(value)
 
         # Use command API instead of settings PATCH endpoint
         payload = {"command": {"update_settings": {setting: value}}}
@@ -719,6 +731,27 @@ class QvantumApi:
                 "smart_dhw_mode": dhw,
             }
 
+        return await self.set_settings(device_id, settings)
+
+    async def set_settings(
+        self, device_id: str, settings: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Update several device settings in a single command.
+
+        Automatically elevates access if any setting reports permission denied.
+
+        Args:
+            device_id: The device ID
+            settings: Mapping of setting name to value
+
+        Returns:
+            API response
+        """
+        settings = {
+            name: _coerce_setting_value(value) for name, value in settings.items()
+        }
+        _LOGGER.debug("Setting %s for device %s", settings, device_id)
+
         # Use command API instead of settings PATCH endpoint
         payload = {"command": {"update_settings": settings}}
 
@@ -738,15 +771,16 @@ class QvantumApi:
                     )
 
             if has_permission_denied:
-                _LOGGER.debug("Elevating access and retrying SmartControl settings")
+                _LOGGER.debug("Elevating access and retrying settings %s", settings)
                 elevated = await self.elevate_access(device_id)
                 if elevated:
-                    _LOGGER.info("Access elevated, retrying SmartControl settings")
+                    _LOGGER.info("Access elevated, retrying settings %s", settings)
                     response = await self._post_request(path, payload)
                 else:
                     _LOGGER.error(
-                        "Failed to elevate access for device %s, cannot set SmartControl",
+                        "Failed to elevate access for device %s, cannot set %s",
                         device_id,
+                        list(settings),
                     )
 
         return response
@@ -293,27 +293,18 @@ class QvantumAlarmStateSensor(QvantumBinarySensorBase):
     @property
     def is_on(self) -> bool:
         """Return true if there are active alarms."""
-        if (
-            self.coordinator.data
-            and "alarms" in self.coordinator.data
-            and "alarms" in self.coordinator.data["alarms"]
-        ):
-            alarms = self.coordinator.data["alarms"]["alarms"]
-            # Check for any active alarms
-            active_alarms = [a for a in alarms if a.get("is_active", False)]
-            return len(active_alarms) > 0
-        return False
+        data = self.coordinator.data
+        view = data.get("alarms_view") if data else None
+        # Check for any active alarms
+        return bool(view and view["active"])
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        if (
-            self.coordinator.data
-            and "alarms" in self.coordinator.data
-            and "alarms" in self.coordinator.data["alarms"]
-        ):
-            alarms = self.coordinator.data["alarms"]["alarms"]
-            active_alarms = [a for a in alarms if a.get("is_active", False)]
+        data = self.coordinator.data
+        view = data.get("alarms_view") if data else None
+        if view is not None:
+            active_alarms = view["active"]
 
             # Get most severe active alarm
             severity_order = {"INFO": 0, "WARNING": 1, "SEVERE": 2, "CRITICAL": 3}
@@ -329,7 +320,7 @@ class QvantumAlarmStateSensor(QvantumBinarySensorBase):
 
             attrs: dict[str, Any] = {
                 "active_alarm_count": len(active_alarms),
-                "total_alarm_count": len(alarms),
+                "total_alarm_count": view["total"],
             }
 
             if most_severe:
@@ -172,7 +172,8 @@ class QvantumRefreshButton(QvantumEntity, ButtonEntity):  # pylint: disable=abst
     async def async_press(self) -> None:
         """Handle the button press."""
         _LOGGER.info("Refreshing sensor data for device %s", self._device["id"])
-        await self.coordinator.async_request_refresh()
+        # Explicit user request: fetch now rather than through the debouncer
+        await self.coordinator.async_refresh()
 
 
 class QvantumElevateAccessButton(QvantumEntity, ButtonEntity):  # pylint: disable=abstract-method
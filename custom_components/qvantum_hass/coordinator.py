@@ -1,8 +1,9 @@
 """Data update coordinator for the Qvantum Heat Pump integration.
 
-This module owns the coordinator class and the CachedValue helper. It sits
-between const/api (which it imports) and the platform files (which import
-it), enabling definitions.py to import platform files without a cycle.
+This module owns the coordinator class, the CachedValue helper and the value
+coercion shared with entities (coerce_bool). It sits between const/api (which
+it imports) and the platform files (which import it), enabling definitions.py
+to import platform files without a cycle.
 
 Import hierarchy (no cycles):
     models.py  ←  const.py  ←  api.py
@@ -16,11 +17,13 @@ Import hierarchy (no cycles):
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 import logging
-from typing import Any, Generic, TypeVar
+from typing import Any, Final, Generic, TypeVar
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
@@ -32,9 +35,150 @@ _LOGGER = logging.getLogger(__name__)
 # Cache TTL for inventory data (24 hours)
 INVENTORY_CACHE_TTL = timedelta(hours=24)
 
+# Quiet period (seconds) used to coalesce refresh requests issued by entity
+# writes, e.g. a script changing several selects back-to-back
+REQUEST_REFRESH_COOLDOWN = 1.0
+
+# Window (seconds) in which setting writes are collected and sent as a single
+# command, e.g. a script toggling several switches back-to-back
+SETTING_WRITE_WINDOW = 0.1
+
 T = TypeVar("T")
 
 
+# String spellings the API uses for a true boolean value
+_TRUTHY_STRINGS: Final = frozenset(("on", "true", "1", "yes"))
+
+# Metrics/settings reported as bool, 0/1 or "on"/"off" depending on firmware.
+# They are normalized to strict bools at ingest so entities can test them
+# directly.
+_BOOL_VALUE_NAMES: Final = frozenset(("use_adaptive",))
+
+
+# Metrics/settings holding integer codes or whole-number targets. The API may
+# report them as float or numeric string; they are normalized to int at ingest
+# so entities can use them directly as lookup keys.
+_INT_VALUE_NAMES: Final = frozenset(
+    (
+        "bt4config",
+        "btxconfig",
+        "dhw_mode",
+        "dhw_outl_temp_5",
+        "dhw_prioritytime",
+        "guide_he",
+        "hp_status",
+        "indoor_temperature_offset",
+        "indoor_temperature_target",
+        "man_mode",
+        "op_mode",
+        "op_mode_sensor",
+        "smart_sh_mode",
+        "tap_water_capacity_target",
+    )
+)
+
+
+def coerce_bool(value: Any) -> Any:
+    """Normalize a boolean-like API value to a bool.
+
+    Args:
+        value: Raw value as returned by the API.
+
+    Returns:
+        A bool for string and numeric values; any other value unchanged.
+
+    """
+    if isinstance(value, str):
+        return value.lower() in _TRUTHY_STRINGS
+    if isinstance(value, (int, float)):
+        return bool(value)
+    return value
+
+
+def _coerce_int(value: Any) -> Any:
+    """Normalize a whole-number API value to an int.
+
+    Args:
+        value: Raw value as returned by the API.
+
+    Returns:
+        An int for whole-number floats and integer strings; any other value
+        unchanged.
+
+    """
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _normalize_values(values: Any) -> None:
+    """Normalize known mixed-representation values in place.
+
+    Args:
+        values: Mapping of metric or setting names to raw values.
+
+    """
+    if not isinstance(values, dict):
+        return
+    for name in _BOOL_VALUE_NAMES:
+        if name in values:
+            values[name] = coerce_bool(values[name])
+    for name in _INT_VALUE_NAMES:
+        if name in values:
+            values[name] = _coerce_int(values[name])
+
+
+def _index_settings(settings: Any) -> dict[str, Any]:
+    """Index a settings response by setting name.
+
+    Args:
+        settings: Settings response (``{"settings": [{"name", "value", ...}]}``)
+            or None when the endpoint was unavailable.
+
+    Returns:
+        Mapping of setting name to its current value.
+
+    """
+    if not isinstance(settings, dict):
+        return {}
+    return {
+        setting["name"]: setting.get("value")
+        for setting in settings.get("settings") or ()
+        if "name" in setting
+    }
+
+
+def _build_alarms_view(alarms_response: Any) -> dict[str, Any] | None:
+    """Pre-filter an alarms response for the alarm entities.
+
+    Args:
+        alarms_response: Alarms response (``{"alarms": [{...}, ...]}``).
+
+    Returns:
+        Dict with the ``active`` alarm list and the ``acknowledged`` and
+        ``total`` counts, or None if the response has no alarm list.
+
+    """
+    if not isinstance(alarms_response, dict):
+        return None
+    alarms = alarms_response.get("alarms")
+    if alarms is None:
+        return None
+    active: list[dict[str, Any]] = []
+    acknowledged = 0
+    for alarm in alarms:
+        if alarm.get("is_active", False):
+            active.append(alarm)
+        if alarm.get("is_acknowledged", False):
+            acknowledged += 1
+    return {"active": active, "acknowledged": acknowledged, "total": len(alarms)}
+
+
 class CachedValue(Generic[T]):
     """Generic cached value with TTL support.
 
@@ -139,6 +283,13 @@ class QvantumDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             name=f"{DOMAIN}_{device_id}_{'normal' if fetch_full_data else 'fast'}",
             update_interval=update_interval,
             config_entry=config_entry,
+            # Coalesce write-triggered refresh requests into a single fetch
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
         # Initialize cached inventories with TTL (Issue #18)
         # Fast coordinators (fetch_full_data=False) don't need inventories
@@ -157,6 +308,12 @@ class QvantumDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.auto_elevate_enabled = False
         # Linked coordinator (e.g. fast ↔ normal) that must stay in sync
         self._linked_coordinator: QvantumDataUpdateCoordinator | None = None
+        # Setting writes waiting for the current write window to close, and
+        # the future their callers await for the shared command's response
+        self._pending_writes: dict[str, Any] = {}
+        self._pending_writes_future: asyncio.Future[dict[str, Any]] | None = None
+        # Timer that closes the write window
+        self._flush_handle: asyncio.TimerHandle | None = None
 
     def set_linked_coordinator(
         self, coordinator: QvantumDataUpdateCoordinator
@@ -212,6 +369,126 @@ class QvantumDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             enabled,
         )
 
+    @callback
+    def async_set_optimistic_value(self, name: str, value: Any) -> None:
+        """Write a value the device just accepted into the cached data.
+
+        Args:
+            name: Setting name that was written
+            value: Value in the normalized form the coordinator stores
+        """
+        self.async_set_optimistic_values({name: value})
+
+    @callback
+    def async_set_optimistic_values(self, values: dict[str, Any]) -> None:
+        """Write values the device just accepted into the cached data.
+
+        Listeners are notified once, immediately, so entities reflect the
+        change without waiting for a refresh; the next fetch replaces the
+        values with the device-reported ones.
+
+        Args:
+            values: Mapping of setting name to value, in the normalized form
+                the coordinator stores
+        """
+        data = self.data
+        if not data:
+            return
+        settings_by_name = data.get("settings_by_name")
+        # Keep the metric copy in step so metrics-first readers agree
+        internal_metrics = data.get("internal_metrics")
+        for name, value in values.items():
+            if settings_by_name is not None:
+                settings_by_name[name] = value
+            if internal_metrics and name in internal_metrics:
+                internal_metrics[name] = value
+        self.async_set_updated_data(data)
+
+    async def async_schedule_setting(self, name: str, value: Any) -> dict[str, Any]:
+        """Write a setting, coalescing it with writes issued close together.
+
+        Writes scheduled within ``SETTING_WRITE_WINDOW`` of the first one are
+        sent to the device as one command. A later write to the same setting
+        replaces the queued value.
+
+        Args:
+            name: Setting name to write
+            value: Value to write
+
+        Returns:
+            API response of the command that carried the write
+
+        Raises:
+            QvantumApiError: If the command fails
+        """
+        self._pending_writes[name] = value
+        if self._pending_writes_future is None:
+            self._pending_writes_future = self.hass.loop.create_future()
+            # Retrieve a failure even if every waiting caller was cancelled
+            self._pending_writes_future.add_done_callback(self._log_write_failure)
+            self._flush_handle = self.hass.loop.call_later(
+                SETTING_WRITE_WINDOW, self._flush_writes
+            )
+        # Shield the shared future so one cancelled caller doesn't cancel the
+        # write for every other caller in the batch
+        return await asyncio.shield(self._pending_writes_future)
+
+    @callback
+    def _take_pending_writes(
+        self,
+    ) -> tuple[dict[str, Any], asyncio.Future[dict[str, Any]]] | None:
+        """Close the write window and return the queued writes and their future."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        writes, self._pending_writes = self._pending_writes, {}
+        future, self._pending_writes_future = self._pending_writes_future, None
+        if future is None:
+            return None
+        return writes, future
+
+    @callback
+    def _flush_writes(self) -> None:
+        """Send the queued writes once the write window closes."""
+        pending = self._take_pending_writes()
+        if pending is not None:
+            self.hass.async_create_task(self._async_write_settings(*pending))
+
+    async def async_shutdown(self) -> None:
+        """Send any queued setting writes, then stop the coordinator.
+
+        Must run before the API session is closed so a write queued just
+        before unload still reaches the device and its callers are resolved.
+        """
+        pending = self._take_pending_writes()
+        if pending is not None:
+            await self._async_write_settings(*pending)
+        await super().async_shutdown()
+
+    @callback
+    def _log_write_failure(self, future: asyncio.Future[dict[str, Any]]) -> None:
+        """Log a failed setting write, marking its exception as retrieved."""
+        if future.cancelled():
+            return
+        err = future.exception()
+        if err is not None:
+            _LOGGER.debug("Setting write failed for %s: %s", self.device_id, err)
+
+    async def _async_write_settings(
+        self, writes: dict[str, Any], future: asyncio.Future[dict[str, Any]]
+    ) -> None:
+        """Send queued writes and hand the outcome to every waiting caller."""
+        try:
+            if len(writes) == 1:
+                ((name, value),) = writes.items()
+                response = await self.api.set_setting(self.device_id, name, value)
+            else:
+                response = await self.api.set_settings(self.device_id, writes)
+        except Exception as err:  # noqa: BLE001 - re-raised in each caller
+            future.set_exception(err)
+        else:
+            future.set_result(response)
+
     async def _async_update_data(self) -> dict[str, Any]:  # noqa: C901
         """Fetch data from API (async, no executor needed)."""
         data = {}
@@ -332,6 +609,10 @@ class QvantumDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # Other errors - log and continue without settings
             _LOGGER.debug("Settings endpoint error for %s: %s", self.device_id, err)
 
+        # Index settings by name once per update so entities can do a single
+        # dict lookup instead of scanning the settings list.
+        data["settings_by_name"] = _index_settings(data.get("settings"))
+
         # Get internal metrics
         try:
             metrics = await self.api.get_internal_metrics(
@@ -363,6 +644,10 @@ class QvantumDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     "Error fetching internal metrics for %s: %s", self.device_id, err
                 )
 
+        # Normalize mixed-representation values once for all entities
+        _normalize_values(data.get("internal_metrics"))
+        _normalize_values(data["settings_by_name"])
+
         # Get settings inventory (cached with TTL - Issue #18)
         if not self._settings_inventory.is_cached():
             try:
@@ -425,6 +710,8 @@ class QvantumDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except QvantumApiError as err:
             _LOGGER.debug("Error fetching alarms for %s: %s", self.device_id, err)
             data["alarms"] = {"alarms": []}
+        # Filter alarms once for all alarm entities
+        data["alarms_view"] = _build_alarms_view(data["alarms"])
 
         # Get alarms inventory (cached with TTL - Issue #18)
         if not self._alarms_inventory.is_cached():
@@ -53,16 +53,35 @@ def create_device_info(device: dict[str, Any]) -> DeviceInfo:
     )
 
 
+def command_applied(response: dict[str, Any] | None) -> bool:
+    """Return whether a write command response reports the value as applied.
+
+    Args:
+        response: Response returned by a QvantumApi write method
+
+    Returns:
+        True if the device applied the new value.
+
+    """
+    return bool(response) and "APPLIED" in (
+        response.get("status"),
+        response.get("heatpump_status"),
+    )
+
+
 class QvantumEntity(CoordinatorEntity[QvantumDataUpdateCoordinator]):
     """Base entity class for all Qvantum entities.
 
     Provides common functionality shared across all entity types including:
     - Device information setup
     - Availability checking based on connectivity
+    - Value lookups against the coordinator's normalized data
     - Reference to device and API
 
     """
 
+    __slots__ = ("_device", "_device_id", "_api", "_unavailable_logged")
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -80,6 +99,7 @@ class QvantumEntity(CoordinatorEntity[QvantumDataUpdateCoordinator]):
         """
         super().__init__(coordinator)
         self._device = device
+        self._device_id: str = device["id"]
         self._api = api
         self._attr_device_info = create_device_info(device)
         self._unavailable_logged = False
@@ -109,15 +129,73 @@ class QvantumEntity(CoordinatorEntity[QvantumDataUpdateCoordinator]):
                 if not self._unavailable_logged:
                     _LOGGER.info(
                         "Device %s is not connected",
-                        self._device.get("id", "unknown"),
+                        self._device_id,
                     )
                     self._unavailable_logged = True
                 return False
             if self._unavailable_logged:
                 _LOGGER.info(
                     "Device %s is back online",
-                    self._device.get("id", "unknown"),
+                    self._device_id,
                 )
                 self._unavailable_logged = False
 
         return True
+
+    def _settings_by_name(self) -> dict[str, Any] | None:
+        """Return the coordinator's settings index.
+
+        Returns:
+            Setting values keyed by name, or None before the first update.
+
+        """
+        data = self.coordinator.data
+        return data.get("settings_by_name") if data else None
+
+    def _setting_value(self, name: str) -> Any:
+        """Return a setting value from the coordinator's settings index.
+
+        Args:
+            name: Setting name to look up.
+
+        Returns:
+            The setting value, or None if the setting is not present.
+
+        """
+        settings = self._settings_by_name()
+        return settings.get(name) if settings else None
+
+    def _metric_value(self, name: str) -> Any:
+        """Return a value from the coordinator's internal_metrics.
+
+        Args:
+            name: Metric name to look up.
+
+        Returns:
+            The metric value, or None if it is not present.
+
+        """
+        data = self.coordinator.data
+        internal_metrics = data.get("internal_metrics") if data else None
+        return internal_metrics.get(name) if internal_metrics else None
+
+    def _metric_or_setting_value(self, name: str) -> Any:
+        """Return a value from internal_metrics, falling back to settings.
+
+        Args:
+            name: Metric/setting name to look up.
+
+        Returns:
+            The metric value if present, else the setting value, else None.
+
+        """
+        data = self.coordinator.data
+        if not data:
+            return None
+        internal_metrics = data.get("internal_metrics")
+        if internal_metrics:
+            value = internal_metrics.get(name)
+            if value is not None:
+                return value
+        settings = data.get("settings_by_name")
+        return settings.get(name) if settings else None
@@ -156,35 +156,30 @@ class QvantumNumberEntity(QvantumEntity, NumberEntity):  # pylint: disable=abstr
         """Return the current value."""
         # Get actual value from coordinator
         actual_value = None
-        if (
-            self.coordinator.data
-            and "settings" in self.coordinator.data
-            and "settings" in self.coordinator.data["settings"]
-        ):
-            for setting in self.coordinator.data["settings"]["settings"]:
-                if setting["name"] == self._setting_name:
-                    value = setting.get("value")
-                    if value is not None:
-                        try:
-                            actual_value = float(value)
-                        except (ValueError, TypeError):
-                            _LOGGER.warning(
-                                "Could not convert value %s to float for %s",
-                                value,
-                                self._setting_name,
-                            )
-                    else:
-                        _LOGGER.debug(
-                            "Setting %s found but value is None (may require higher access)",
+        settings = self._settings_by_name()
+        if settings is not None:
+            if self._setting_name in settings:
+                value = settings[self._setting_name]
+                if value is not None:
+                    try:
+                        actual_value = float(value)
+                    except (ValueError, TypeError):
+                        _LOGGER.warning(
+                            "Could not convert value %s to float for %s",
+                            value,
                             self._setting_name,
                         )
-                    break
+                else:
+                    _LOGGER.debug(
+                        "Setting %s found but value is None (may require higher access)",
+                        self._setting_name,
+                    )
             else:
                 # Setting not found in response
                 _LOGGER.debug(
                     "Setting %s not found in settings response (total settings: %d, access level: %s)",
                     self._setting_name,
-                    len(self.coordinator.data["settings"]["settings"]),
+                    len(settings),
                     self.coordinator.data.get("access_level", {}).get(
                         "writeAccessLevel", "unknown"
                     ),
@@ -18,18 +18,21 @@ values, making configuration more intuitive.
 
 from __future__ import annotations
 
+from abc import abstractmethod
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
 import logging
-from typing import Any, Final
+from typing import Any, ClassVar, Final
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .api import QvantumApi, QvantumApiError
 from .coordinator import QvantumDataUpdateCoordinator
-from .entity import QvantumEntity
+from .entity import QvantumEntity, command_applied
 from .models import EntitySource, QvantumEntityDef
 
 PARALLEL_UPDATES = 0
@@ -68,6 +71,12 @@ TAP_WATER_CAPACITY_MAP: Final = {
     5: "5_persons",
 }
 
+DHW_MODE_MAP: Final = {
+    0: "eco",
+    1: "normal",
+    2: "extra",
+}
+
 MAN_MODE_MAP: Final = {
     0: "off",
     1: "heating",
@@ -124,6 +133,35 @@ INDOOR_TEMP_TARGET_MAP: Final = {
     25: "temp_25c",
 }
 
+SMARTCONTROL_MODE_MAP: Final = {
+    -1: "off",
+    0: "eco",
+    1: "balanced",
+    2: "comfort",
+}
+
+# Standard option lists for selects that may append a read-only custom entry
+HOT_WATER_PRIORITY_OPTIONS: Final = tuple(HOT_WATER_PRIORITY_MAP.values())
+HOT_WATER_TEMP_OPTIONS: Final = tuple(HOT_WATER_TEMP_MAP.values())
+
+# Reverse option-to-value maps for the bespoke selects that write these back
+HOT_WATER_PRIORITY_OPTION_MAP: Final = {
+    label: minutes for minutes, label in HOT_WATER_PRIORITY_MAP.items()
+}
+HOT_WATER_TEMP_OPTION_MAP: Final = {
+    label: temp for temp, label in HOT_WATER_TEMP_MAP.items()
+}
+MAN_MODE_OPTION_MAP: Final = {label: mode for mode, label in MAN_MODE_MAP.items()}
+
+# Shared option list and reverse map for the SmartControl select
+SMARTCONTROL_OPTIONS: Final[list[str]] = list(SMARTCONTROL_MODE_MAP.values())
+SMARTCONTROL_OPTION_MAP: Final = {
+    label: mode for mode, label in SMARTCONTROL_MODE_MAP.items()
+}
+
+# Shared option list for the manual mode select
+MAN_MODE_SELECT_OPTIONS: Final[list[str]] = list(MAN_MODE_MAP.values())
+
 
 # =============================================================================
 # Entity definitions for this platform
@@ -135,8 +173,8 @@ INDOOR_TEMP_TARGET_MAP: Final = {
 ENTITY_DEFS: Final[list[QvantumEntityDef]] = [
     # =========================================================================
     # SELECT ENTITIES (various sources)
-    # Named-option controls for heat pump settings. Each has a custom class
-    # in select.py with its own value mapping and API interaction.
+    # Named-option controls for heat pump settings. Simple value mappings are
+    # described in MAPPED_SELECT_DESCS; the rest have a dedicated class.
     # =========================================================================
     QvantumEntityDef(
         "indoor_temperature_target",
@@ -217,12 +255,168 @@ ENTITY_DEFS: Final[list[QvantumEntityDef]] = [
     ),
 ]
 
+# Keys are unique within the platform (enforced by test_entity_definitions)
+_ENTITY_DEFS_BY_KEY: Final = {e.key: e for e in ENTITY_DEFS}
+
 _LOGGER = logging.getLogger(__name__)
 
 
 def get_entity_def(key: str) -> QvantumEntityDef | None:
     """Look up an entity definition by key within this platform's entity definitions."""
-    return next((e for e in ENTITY_DEFS if e.key == key), None)
+    return _ENTITY_DEFS_BY_KEY.get(key)
+
+
+def _enabled_by_default(key: str) -> bool:
+    """Return whether the entity with the given definition key starts enabled."""
+    entity_def = get_entity_def(key)
+    return entity_def.enabled_by_default if entity_def else True
+
+
+def _has_values(
+    data: dict[str, Any] | None,
+    names: tuple[str, ...],
+    *,
+    settings_only: bool = False,
+) -> bool:
+    """Return whether the device reports every named value.
+
+    An empty or missing internal_metrics or settings index (e.g. after a
+    partial first fetch) leaves the device's capabilities unknown, so every
+    value is assumed present rather than dropping entities until a reload.
+
+    Args:
+        data: Coordinator data dict
+        names: Names of the values an entity reads
+        settings_only: The entity reads the names from settings only, so
+            only the settings index is consulted.
+
+    Returns:
+        True if each name is reported, or if that cannot be told yet.
+
+    """
+    if not data:
+        return True
+    settings = data.get("settings_by_name")
+    if settings_only:
+        return not settings or all(name in settings for name in names)
+    internal_metrics = data.get("internal_metrics")
+    if not internal_metrics or not settings:
+        return True
+    return all(name in internal_metrics or name in settings for name in names)
+
+
+# =============================================================================
+# Mapped select descriptions
+#
+# Selects that map one setting onto a fixed set of named options are
+# declared as data here and served by QvantumMappedSelect, instead of each
+# having a near-identical class.
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class QvantumSelectDesc:
+    """Static description of a select backed by a single mapped setting.
+
+    Attributes:
+        key: Entity definition key, also used as the translation key.
+        setting_name: Setting (and internal metric) name read and written.
+        value_to_label: Maps device values to option strings.
+        icon: Material Design icon for the entity.
+        unique_suffix: Suffix appended to the device id for the unique_id.
+        metrics_first: Read internal_metrics before falling back to settings.
+        coerce: Converts the raw API value into a ``value_to_label`` key, or
+            None when the coordinator already delivers it as the key type.
+        label_to_value: Reverse of ``value_to_label``, derived automatically.
+        options: Option list in ``value_to_label`` order, derived automatically.
+        enabled_by_default: Registry default from the entity definition,
+            derived automatically.
+    """
+
+    key: str
+    setting_name: str
+    value_to_label: Mapping[Any, str]
+    icon: str
+    unique_suffix: str
+    metrics_first: bool = False
+    coerce: Callable[[Any], Any] | None = None
+    label_to_value: Mapping[str, Any] = field(init=False)
+    options: list[str] = field(init=False)
+    enabled_by_default: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Derive the reverse mapping, option list and enabled default."""
+        object.__setattr__(
+            self,
+            "label_to_value",
+            {label: value for value, label in self.value_to_label.items()},
+        )
+        object.__setattr__(self, "options", list(self.value_to_label.values()))
+        object.__setattr__(
+            self, "enabled_by_default", _enabled_by_default(self.key)
+        )
+
+
+MAPPED_SELECT_DESCS: Final[tuple[QvantumSelectDesc, ...]] = (
+    QvantumSelectDesc(
+        key="indoor_temperature_target",
+        setting_name="indoor_temperature_target",
+        value_to_label=INDOOR_TEMP_TARGET_MAP,
+        icon="mdi:home-thermometer",
+        unique_suffix="indoor_temp_target",
+        # Fractional values are not normalized; truncate to the map key
+        coerce=int,
+    ),
+    QvantumSelectDesc(
+        key="tap_water_capacity_target",
+        setting_name="tap_water_capacity_target",
+        value_to_label=TAP_WATER_CAPACITY_MAP,
+        icon="mdi:account-multiple",
+        unique_suffix="tap_water_capacity_target",
+    ),
+    QvantumSelectDesc(
+        key="dhw_mode",
+        setting_name="dhw_mode",
+        value_to_label=DHW_MODE_MAP,
+        icon="mdi:water-thermometer",
+        unique_suffix="dhw_mode",
+        metrics_first=True,
+    ),
+    QvantumSelectDesc(
+        key="operation_mode",
+        setting_name="op_mode",
+        value_to_label=OP_MODE_MAP,
+        icon="mdi:cog",
+        unique_suffix="operation_mode",
+        metrics_first=True,
+    ),
+    QvantumSelectDesc(
+        key="room_comp_factor",
+        setting_name="room_comp_factor",
+        value_to_label=ROOM_COMP_MAP,
+        icon="mdi:thermometer-lines",
+        unique_suffix="room_comp_factor",
+        metrics_first=True,
+        coerce=float,
+    ),
+    QvantumSelectDesc(
+        key="heating_curve_shift",
+        setting_name="indoor_temperature_offset",
+        value_to_label=CURVE_SHIFT_MAP,
+        icon="mdi:chart-bell-curve-cumulative",
+        unique_suffix="curve_shift",
+        # Fractional values are not normalized; truncate to the map key
+        coerce=int,
+    ),
+    QvantumSelectDesc(
+        # Reads/writes string values: off, bt2, bt3, btx
+        key="sensor_mode",
+        setting_name="sensor_mode",
+        value_to_label=SENSOR_MODE_OPTIONS,
+        icon="mdi:thermometer-check",
+        unique_suffix="sensor_mode",
+    ),
+)
 
 
 async def async_setup_entry(
@@ -236,289 +430,242 @@ async def async_setup_entry(
     devices = data["devices"]
     api = data["api"]
 
-    entities = []
+    entities: list[QvantumSelectEntity] = []
 
     for device in devices:
-        device_id = device["id"]
-        coordinator = coordinators[device_id]
-
-        # Add Indoor Temperature Target select entity
-        entities.append(
-            QvantumIndoorTempTargetSelect(
-                coordinator,
-                device,
-                api,
+        coordinator = coordinators[device["id"]]
+        # Only create selects for values this device actually reports
+        entities.extend(
+            QvantumMappedSelect(coordinator, device, api, description)
+            for description in MAPPED_SELECT_DESCS
+            if _has_values(
+                coordinator.data,
+                (description.setting_name,),
+                settings_only=not description.metrics_first,
             )
         )
-
-        # Add SmartControl select entity
-        entities.append(
-            QvantumSmartControlSelect(
-                coordinator,
-                device,
-                api,
-            )
+        entities.extend(
+            cls(coordinator, device, api)
+            for cls in _SELECT_CLASSES
+            if _has_values(coordinator.data, cls.required_values)
         )
 
-        # Add tap water capacity target select entity
-        entities.append(
-            QvantumTapWaterCapacitySelect(
-                coordinator,
-                device,
-                api,
-            )
-        )
+    async_add_entities(entities)
 
-        # Add DHW Priority select entity
-        entities.append(
-            QvantumDHWPrioritySelect(
-                coordinator,
-                device,
-                api,
-            )
-        )
 
-        # Add DHW Out Temp select entity
-        entities.append(
-            QvantumDHWOutTempSelect(
-                coordinator,
-                device,
-                api,
-            )
-        )
+class QvantumSelectEntity(QvantumEntity, SelectEntity):  # pylint: disable=abstract-method
+    """Base class for Qvantum select entities.
 
-        # Add DHW Mode select entity
-        entities.append(
-            QvantumDHWModeSelect(
-                coordinator,
-                device,
-                api,
-            )
-        )
+    The current option is derived from coordinator data once per coordinator
+    update and stored in ``_attr_current_option``, so state reads between
+    updates are served by SelectEntity's plain attribute lookup instead of a
+    walk over the settings payload.
+    """
 
-        # Add Operation Mode select entity
-        entities.append(
-            QvantumOperationModeSelect(
-                coordinator,
-                device,
-                api,
-            )
-        )
+    __slots__ = ()
 
-        # Add Manual Mode select entity (off/heating/cooling)
-        entities.append(
-            QvantumManualModeSelect(
-                coordinator,
-                device,
-                api,
-            )
-        )
+    # Values the device must report for the entity to be created
+    required_values: ClassVar[tuple[str, ...]] = ()
 
-        # Add Room Compensation Factor select entity
-        entities.append(
-            QvantumRoomCompFactorSelect(
-                coordinator,
-                device,
-                api,
-            )
-        )
+    @abstractmethod
+    def _compute_current_option(self) -> str | None:
+        """Compute the selected option from coordinator data.
 
-        # Add Heating Curve Shift select entity
-        entities.append(
-            QvantumCurveShiftSelect(
-                coordinator,
-                device,
-                api,
-            )
-        )
+        Returns:
+            The option matching the current device value, or None.
 
-        # Add Sensor Mode select entity
-        entities.append(
-            QvantumSensorModeSelect(
-                coordinator,
-                device,
-                api,
-            )
-        )
+        """
 
-    async_add_entities(entities)
+    def _refresh_cached_state(self) -> None:
+        """Recompute all state derived from coordinator data."""
+        self._attr_current_option = self._compute_current_option()
 
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial state when the entity is added."""
+        await super().async_added_to_hass()
+        self._refresh_cached_state()
 
-class QvantumIndoorTempTargetSelect(QvantumEntity, SelectEntity):  # pylint: disable=abstract-method
-    """Select entity for Indoor Temperature Target."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the cached state before writing it to Home Assistant."""
+        # A failed update leaves the entity unavailable, so its option is
+        # not shown; keep the last state until data arrives again
+        if self.coordinator.last_update_success:
+            self._refresh_cached_state()
+        super()._handle_coordinator_update()
+
+
+class QvantumMappedSelect(QvantumSelectEntity):
+    """Select entity for a single setting with a fixed value-to-option map."""
+
+    __slots__ = ("_desc",)
+
+    _attr_entity_category = EntityCategory.CONFIG
 
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
         device: dict[str, Any],
         api: QvantumApi,
+        description: QvantumSelectDesc,
     ) -> None:
-        """Initialize the select entity."""
+        """Initialize the select entity.
+
+        Args:
+            coordinator: Data update coordinator instance.
+            device: Device dictionary containing id, serial, model, etc.
+            api: Qvantum API instance.
+            description: Static description of the mapped setting.
+        """
         super().__init__(coordinator, device, api)
-        self._attr_translation_key = "indoor_temperature_target"
-        self._attr_unique_id = f"{device['id']}_indoor_temp_target"
-        self._attr_icon = "mdi:home-thermometer"
-        self._attr_entity_category = EntityCategory.CONFIG
-        # Check if this should be enabled by default
-        _def = get_entity_def("indoor_temperature_target")
-        self._attr_entity_registry_enabled_default = (
-            _def.enabled_by_default if _def else True
-        )
-        self._attr_options = list(INDOOR_TEMP_TARGET_MAP.values())
+        self._desc = description
+        self._attr_translation_key = description.key
+        self._attr_unique_id = f"{self._device_id}_{description.unique_suffix}"
+        self._attr_icon = description.icon
+        self._attr_options = description.options
+        self._attr_entity_registry_enabled_default = description.enabled_by_default
+
+    def _compute_current_option(self) -> str | None:
+        """Compute the selected option from coordinator data."""
+        desc = self._desc
+        # Try internal_metrics first where the setting is also a metric
+        if desc.metrics_first:
+            value = self._metric_or_setting_value(desc.setting_name)
+        else:
+            value = self._setting_value(desc.setting_name)
 
-    @property
-    def current_option(self) -> str | None:
-        """Return the currently selected option."""
-        if (
-            self.coordinator.data
-            and "settings" in self.coordinator.data
-            and "settings" in self.coordinator.data["settings"]
-        ):
-            for setting in self.coordinator.data["settings"]["settings"]:
-                if setting["name"] == "indoor_temperature_target":
-                    value = setting.get("value")
-                    if value is not None:
-                        try:
-                            # Convert value to int for comparison
-                            int_value = int(value)
-                            return INDOOR_TEMP_TARGET_MAP.get(int_value)
-                        except (ValueError, TypeError):
-                            _LOGGER.warning(
-                                "Could not convert indoor_temperature_target value %s to int",
-                                value,
-                            )
-        return None
+        if value is None:
+            return None
+
+        # Integer-coded settings are normalized by the coordinator and numeric
+        # values hash equal to their map keys, so look them up directly first
+        label = desc.value_to_label.get(value)
+        if label is not None or desc.coerce is None:
+            return label
+
+        # Fall back to coercion only for values such as numeric strings
+        try:
+            return desc.value_to_label.get(desc.coerce(value))
+        except (ValueError, TypeError):
+            _LOGGER.warning(
+                "Could not convert %s value %s",
+                desc.setting_name,
+                value,
+            )
+            return None
 
     async def async_select_option(self, option: str) -> None:
-        """Set the indoor temperature target."""
-        # Find the numeric value for the selected option
-        value = None
-        for val, label in INDOOR_TEMP_TARGET_MAP.items():
-            if label == option:
-                value = val
-                break
+        """Write the value for the selected option."""
+        desc = self._desc
+        value = desc.label_to_value.get(option)
 
         if value is None:
-            _LOGGER.error("Invalid indoor temperature target option: %s", option)
+            _LOGGER.error("Invalid %s option: %s", desc.key, option)
+            return
+
+        # Nothing to write when the option is already selected
+        if option == self.current_option:
             return
 
         try:
-            await self._api.set_setting(
-                self._device["id"],
-                "indoor_temperature_target",
+            response = await self._api.set_setting(
+                self._device_id,
+                desc.setting_name,
                 value,
             )
             _LOGGER.info(
-                "Set indoor temperature target to %s (%s) on device %s",
+                "Set %s to %s (%s) on device %s",
+                desc.setting_name,
                 option,
                 value,
-                self._device["id"],
+                self._device_id,
             )
+            # Reflect an applied value now; the refresh below confirms it
+            if command_applied(response):
+                self.coordinator.async_set_optimistic_value(desc.setting_name, value)
             # Request immediate update
             await self.coordinator.async_request_refresh()
         except QvantumApiError as err:
             _LOGGER.error(
-                "Failed to set indoor temperature target: %s",
+                "Failed to set %s: %s",
+                desc.setting_name,
                 err,
             )
 
 
-class QvantumSmartControlSelect(QvantumEntity, SelectEntity):  # pylint: disable=abstract-method
+class QvantumSmartControlSelect(QvantumSelectEntity):
     """Select entity for SmartControl mode."""
 
+    __slots__ = ()
+    _attr_entity_registry_enabled_default = _enabled_by_default("smartcontrol")
+    required_values = ("use_adaptive", "smart_sh_mode")
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
         device: dict[str, Any],
-        api: Any,
+        api: QvantumApi,
     ) -> None:
         """Initialize the select entity."""
         super().__init__(coordinator, device, api)
         self._attr_translation_key = "smartcontrol"
-        self._attr_unique_id = f"{device['id']}_smartcontrol"
+        self._attr_unique_id = f"{self._device_id}_smartcontrol"
         self._attr_icon = "mdi:leaf"
-        self._attr_options = ["off", "eco", "balanced", "comfort"]
+        self._attr_options = SMARTCONTROL_OPTIONS
         self._attr_entity_category = EntityCategory.CONFIG
-        _def = get_entity_def("smartcontrol")
-        self._attr_entity_registry_enabled_default = (
-            _def.enabled_by_default if _def else True
-        )
 
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected option."""
+    def _compute_current_option(self) -> str | None:
+        """Compute the selected option from coordinator data."""
         if not self.coordinator.data:
             return None
 
         # Get values from internal_metrics (preferred) or settings
-        use_adaptive = None
-        smart_sh_mode = None
-
-        # Check internal_metrics first
-        internal_metrics = self.coordinator.data.get("internal_metrics", {})
-        if internal_metrics:
-            use_adaptive = internal_metrics.get("use_adaptive")
-            smart_sh_mode = internal_metrics.get("smart_sh_mode")
-
-        # Fall back to settings if not found
-        if use_adaptive is None or smart_sh_mode is None:
-            settings = self.coordinator.data.get("settings", {}).get("settings", [])
-            for setting in settings:
-                name = setting.get("name")
-                if name == "use_adaptive" and use_adaptive is None:
-                    use_adaptive = setting.get("value")
-                elif name == "smart_sh_mode" and smart_sh_mode is None:
-                    smart_sh_mode = setting.get("value")
-
-        # Convert use_adaptive to boolean
-        if isinstance(use_adaptive, str):
-            use_adaptive = use_adaptive.lower() in ("on", "true", "1", "yes")
-        elif isinstance(use_adaptive, (int, float)):
-            use_adaptive = bool(use_adaptive)
+        use_adaptive = self._metric_or_setting_value("use_adaptive")
+        smart_sh_mode = self._metric_or_setting_value("smart_sh_mode")
 
+        # use_adaptive is normalized to a bool by the coordinator.
         # If SmartControl is disabled, return Off
         if use_adaptive is False:
             return "off"
 
-        # Map mode value to option (same as async_select_option)
-        mode_map = {-1: "off", 0: "eco", 1: "balanced", 2: "comfort"}
-
-        try:
-            mode_value = int(smart_sh_mode) if smart_sh_mode is not None else -1
-            return mode_map.get(mode_value, "off")
-        except (ValueError, TypeError):
-            _LOGGER.debug(
-                "Invalid smart_sh_mode value %s for device %s, defaulting to off",
-                smart_sh_mode,
-                self._device["id"],
-            )
-            return "off"
+        # smart_sh_mode is normalized to an int by the coordinator; a missing
+        # or unrecognized mode maps to Off
+        return SMARTCONTROL_MODE_MAP.get(smart_sh_mode, "off")
 
     async def async_select_option(self, option: str) -> None:
         """Update the current value."""
+        # Nothing to write when the option is already selected
+        if option == self.current_option:
+            return
+
         # Map option to smart control modes
-        mode_map = {
-            "off": -1,
-            "eco": 0,
-            "balanced": 1,
-            "comfort": 2,
-        }
-
-        mode_value = mode_map.get(option, -1)
+        mode_value = SMARTCONTROL_OPTION_MAP.get(option, -1)
         sh_mode = mode_value
         dhw_mode = mode_value
 
         try:
-            await self._api.set_smartcontrol(
-                self._device["id"],
+            response = await self._api.set_smartcontrol(
+                self._device_id,
                 sh_mode,
                 dhw_mode,
             )
             _LOGGER.info(
                 "Set SmartControl to %s on device %s",
                 option,
-                self._device["id"],
+                self._device_id,
             )
+            # Reflect the applied settings now, matching what
+            # set_smartcontrol wrote; the refresh below confirms them
+            if command_applied(response):
+                if mode_value == -1:
+                    written = {"use_adaptive": False}
+                else:
+                    written = {
+                        "use_adaptive": True,
+                        "smart_sh_mode": sh_mode,
+                        "smart_dhw_mode": dhw_mode,
+                    }
+                self.coordinator.async_set_optimistic_values(written)
             # Request immediate update
             await self.coordinator.async_request_refresh()
         except QvantumApiError as err:
@@ -528,139 +675,62 @@ class QvantumSmartControlSelect(QvantumEntity, SelectEntity):  # pylint: disable
             )
 
 
-class QvantumTapWaterCapacitySelect(QvantumEntity, SelectEntity):  # pylint: disable=abstract-method
-    """Select entity for tap water capacity target (number of people)."""
-
-    def __init__(
-        self,
-        coordinator: QvantumDataUpdateCoordinator,
-        device: dict[str, Any],
-        api: Any,
-    ) -> None:
-        """Initialize the select entity."""
-        super().__init__(coordinator, device, api)
-        self._attr_translation_key = "tap_water_capacity_target"
-        self._attr_unique_id = f"{device['id']}_tap_water_capacity_target"
-        self._attr_icon = "mdi:account-multiple"
-        self._attr_options = list(TAP_WATER_CAPACITY_MAP.values())
-        self._attr_entity_category = EntityCategory.CONFIG
-        _def = get_entity_def("tap_water_capacity_target")
-        self._attr_entity_registry_enabled_default = (
-            _def.enabled_by_default if _def else True
-        )
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected option."""
-        if not self.coordinator.data:
-            return None
-
-        # Check in settings
-        settings = self.coordinator.data.get("settings", {})
-        if "settings" in settings:
-            settings = settings["settings"]
-
-            for setting in settings:
-                if setting.get("name") == "tap_water_capacity_target":
-                    value = setting.get("value")
-                    if value is not None:
-                        # Map numeric value to translation key
-                        try:
-                            int_value = int(value)
-                            return TAP_WATER_CAPACITY_MAP.get(int_value)
-                        except (ValueError, TypeError):
-                            _LOGGER.warning(
-                                "Invalid tap_water_capacity_target value: %s",
-                                value,
-                            )
-
-        return None
-
-    async def async_select_option(self, option: str) -> None:
-        """Update the current value."""
-        # Reverse lookup: find numeric value from translation key
-        people_count = None
-        for value, key in TAP_WATER_CAPACITY_MAP.items():
-            if key == option:
-                people_count = value
-                break
-
-        if people_count is None:
-            _LOGGER.error("Invalid tap water capacity option: %s", option)
-            return
-
-        try:
-            await self._api.set_setting(
-                self._device["id"],
-                "tap_water_capacity_target",
-                people_count,
-            )
-            _LOGGER.info(
-                "Set tap water capacity target to %s person(s) on device %s",
-                people_count,
-                self._device["id"],
-            )
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
-        except QvantumApiError as err:
-            _LOGGER.error(
-                "Failed to set tap water capacity target: %s",
-                err,
-            )
-
-
-class QvantumDHWPrioritySelect(QvantumEntity, SelectEntity):  # pylint: disable=abstract-method
+class QvantumDHWPrioritySelect(QvantumSelectEntity):
     """Select entity for DHW Priority mode."""
 
+    __slots__ = ("_current_custom_value", "_custom_label")
+    _attr_entity_registry_enabled_default = _enabled_by_default("dhw_priority")
+    required_values = ("dhw_prioritytime",)
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
         device: dict[str, Any],
-        api: Any,
+        api: QvantumApi,
     ) -> None:
         """Initialize the select entity."""
         super().__init__(coordinator, device, api)
         self._attr_translation_key = "dhw_priority"
-        self._attr_unique_id = f"{device['id']}_dhw_priority"
+        self._attr_options = list(HOT_WATER_PRIORITY_OPTIONS)
+        self._attr_unique_id = f"{self._device_id}_dhw_priority"
         self._attr_icon = "mdi:water-thermometer"
-        self._current_custom_value = None  # Track custom value
+        self._current_custom_value: int | None = None  # Track custom value
+        self._custom_label: str | None = None  # Option label for the custom value
         self._attr_entity_category = EntityCategory.CONFIG
-        _def = get_entity_def("dhw_priority")
-        self._attr_entity_registry_enabled_default = (
-            _def.enabled_by_default if _def else True
-        )
-
-    @property
-    def options(self) -> list[str]:
-        """Return the list of available options."""
-        base_options = list(HOT_WATER_PRIORITY_MAP.values())
-        if self._current_custom_value is not None:
-            # Add custom option
-            base_options.append(f"Custom ({self._current_custom_value} minutes)")
-        return base_options
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected option."""
-        if not self.coordinator.data:
-            return None
 
-        # Try to get value from internal_metrics first, then settings
-        value = None
+    def _set_custom_value(self, value: int | None) -> None:
+        """Track a non-standard device value and rebuild options on change.
 
-        internal_metrics = self.coordinator.data.get("internal_metrics", {})
-        if internal_metrics:
-            value = internal_metrics.get("dhw_prioritytime")
+        Args:
+            value: The custom value reported by the device, or None when the
+                device is back on a standard value.
 
-        if value is None:
-            settings = self.coordinator.data.get("settings", {})
-            if "settings" in settings:
-                for setting in settings["settings"]:
-                    if setting.get("name") == "dhw_prioritytime":
-                        value = setting.get("value")
-                        break
-
-        # Map value to option using HOT_WATER_PRIORITY_MAP
+        """
+        if value == self._current_custom_value:
+            return
+        self._current_custom_value = value
+        options = list(HOT_WATER_PRIORITY_OPTIONS)
+        if value is not None:
+            # Add custom option
+            self._custom_label = f"Custom ({value} minutes)"
+            options.append(self._custom_label)
+        else:
+            self._custom_label = None
+        self._attr_options = options
+
+    def _compute_current_option(self) -> str | None:
+        """Compute the selected option from coordinator data."""
+        # Try internal_metrics first, then settings
+        value = self._metric_or_setting_value("dhw_prioritytime")
+
+        # Standard values arrive normalized to int and match directly
+        label = HOT_WATER_PRIORITY_MAP.get(value)
+        if label is not None:
+            # Clear custom value if we're back to a standard value
+            self._set_custom_value(None)
+            return label
+
+        # Map any other value to option using HOT_WATER_PRIORITY_MAP
         if value is not None:
             try:
                 value_int = int(value)
@@ -669,7 +739,7 @@ class QvantumDHWPrioritySelect(QvantumEntity, SelectEntity):  # pylint: disable=
             else:
                 if value_int in HOT_WATER_PRIORITY_MAP:
                     # Clear custom value if we're back to a standard value
-                    self._current_custom_value = None
+                    self._set_custom_value(None)
                     return HOT_WATER_PRIORITY_MAP[value_int]
 
                 # Custom value detected
@@ -677,39 +747,38 @@ class QvantumDHWPrioritySelect(QvantumEntity, SelectEntity):  # pylint: disable=
                     "DHW priority time has custom value %s minutes (device %s). "
                     "Expected one of: %s",
                     value_int,
-                    self._device["id"],
+                    self._device_id,
                     list(HOT_WATER_PRIORITY_MAP.keys()),
                 )
-                self._current_custom_value = value_int
-                return f"Custom ({value_int} minutes)"
+                self._set_custom_value(value_int)
+                return self._custom_label
 
         # Clear custom value and return default
-        self._current_custom_value = None
+        self._set_custom_value(None)
         return HOT_WATER_PRIORITY_MAP[30]  # Default to normal_30min
 
     async def async_select_option(self, option: str) -> None:
         """Update the current value."""
         # Ignore custom option selection (read-only)
-        if option.startswith("Custom ("):
+        if self._custom_label is not None and option == self._custom_label:
             _LOGGER.warning(
                 "Cannot set custom DHW priority value. Please select a standard option"
             )
             return
 
-        # Reverse map option to value using HOT_WATER_PRIORITY_MAP
-        value = None
-        for minutes, label in HOT_WATER_PRIORITY_MAP.items():
-            if label == option:
-                value = minutes
-                break
+        value = HOT_WATER_PRIORITY_OPTION_MAP.get(option)
 
         if value is None:
             _LOGGER.error("Invalid DHW priority option: %s", option)
             return
 
+        # Nothing to write when the option is already selected
+        if option == self.current_option:
+            return
+
         try:
             response = await self._api.set_setting(
-                self._device["id"],
+                self._device_id,
                 "dhw_prioritytime",
                 value,
             )
@@ -717,28 +786,20 @@ class QvantumDHWPrioritySelect(QvantumEntity, SelectEntity):  # pylint: disable=
                 "Set DHW priority time to %s (%s minutes) on device %s",
                 option,
                 value,
-                self._device["id"],
+                self._device_id,
             )
             _LOGGER.debug("API response: %s", response)
 
             # Optimistic update if command was applied
-            if response and (
-                response.get("status") == "APPLIED"
-                or response.get("heatpump_status") == "APPLIED"
-            ):
-                # Update coordinator data immediately
-                if "internal_metrics" in self.coordinator.data:
-                    self.coordinator.data["internal_metrics"]["dhw_prioritytime"] = (
-                        value
-                    )
-                    self.coordinator.async_set_updated_data(self.coordinator.data)
-                    _LOGGER.debug(
-                        "Optimistically updated dhw_prioritytime to %s in coordinator",
-                        value,
-                    )
-
-            # Clear custom value when setting a standard value
-            self._current_custom_value = None
+            if command_applied(response):
+                self.coordinator.async_set_optimistic_value("dhw_prioritytime", value)
+                _LOGGER.debug(
+                    "Optimistically updated dhw_prioritytime to %s in coordinator",
+                    value,
+                )
+
+            # The custom option is cleared by _compute_current_option once
+            # a standard value is reported
             # Request immediate update
             await self.coordinator.async_request_refresh()
         except QvantumApiError as err:
@@ -748,179 +809,13 @@ class QvantumDHWPrioritySelect(QvantumEntity, SelectEntity):  # pylint: disable=
             )
 
 
-class QvantumDHWModeSelect(QvantumEntity, SelectEntity):  # pylint: disable=abstract-method
-    """Select entity for DHW Mode."""
-
-    def __init__(
-        self,
-        coordinator: QvantumDataUpdateCoordinator,
-        device: dict[str, Any],
-        api: Any,
-    ) -> None:
-        """Initialize the select entity."""
-        super().__init__(coordinator, device, api)
-        self._attr_translation_key = "dhw_mode"
-        self._attr_unique_id = f"{device['id']}_dhw_mode"
-        self._attr_icon = "mdi:water-thermometer"
-        self._attr_entity_category = EntityCategory.CONFIG
-        _def = get_entity_def("dhw_mode")
-        self._attr_entity_registry_enabled_default = (
-            _def.enabled_by_default if _def else True
-        )
-
-    @property
-    def options(self) -> list[str]:
-        """Return the list of available options."""
-        return ["eco", "normal", "extra"]
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected option."""
-        if not self.coordinator.data:
-            return None
-
-        # Try to get value from internal_metrics first, then settings
-        value = None
-
-        internal_metrics = self.coordinator.data.get("internal_metrics", {})
-        if internal_metrics:
-            value = internal_metrics.get("dhw_mode")
-
-        if value is None:
-            settings = self.coordinator.data.get("settings", {})
-            if "settings" in settings:
-                for setting in settings["settings"]:
-                    if setting.get("name") == "dhw_mode":
-                        value = setting.get("value")
-                        break
-
-        if value is None:
-            return None
-
-        # Map integer value to option
-        mode_map = {0: "eco", 1: "normal", 2: "extra"}
-        try:
-            return mode_map.get(int(value))
-        except (ValueError, TypeError):
-            return None
-
-    async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
-        # Map option to integer value
-        option_map = {"eco": 0, "normal": 1, "extra": 2}
-        value = option_map.get(option)
-
-        if value is None:
-            _LOGGER.error("Invalid DHW mode option: %s", option)
-            return
-
-        try:
-            await self._api.set_setting(
-                self._device["id"],
-                "dhw_mode",
-                value,
-            )
-            _LOGGER.info(
-                "Set DHW mode to %s on device %s",
-                option,
-                self._device["id"],
-            )
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
-        except (ValueError, QvantumApiError) as err:
-            _LOGGER.error(
-                "Failed to set DHW mode: %s",
-                err,
-            )
-
-
-class QvantumOperationModeSelect(QvantumEntity, SelectEntity):  # pylint: disable=abstract-method
-    """Select entity for Operation Mode."""
-
-    def __init__(
-        self,
-        coordinator: QvantumDataUpdateCoordinator,
-        device: dict[str, Any],
-        api: Any,
-    ) -> None:
-        """Initialize the select entity."""
-        super().__init__(coordinator, device, api)
-        self._attr_translation_key = "operation_mode"
-        self._attr_unique_id = f"{device['id']}_operation_mode"
-        self._attr_icon = "mdi:cog"
-        self._attr_entity_category = EntityCategory.CONFIG
-        _def = get_entity_def("operation_mode")
-        self._attr_entity_registry_enabled_default = (
-            _def.enabled_by_default if _def else True
-        )
-
-    @property
-    def options(self) -> list[str]:
-        """Return the list of available options."""
-        return list(OP_MODE_MAP.values())
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected option."""
-        if not self.coordinator.data:
-            return None
-
-        # Try to get value from internal_metrics first, then settings
-        value = None
-        internal_metrics = self.coordinator.data.get("internal_metrics", {})
-        if internal_metrics:
-            value = internal_metrics.get("op_mode")
-
-        if value is None:
-            settings = self.coordinator.data.get("settings", {})
-            if "settings" in settings:
-                for setting in settings["settings"]:
-                    if setting.get("name") == "op_mode":
-                        value = setting.get("value")
-                        break
-
-        if value is None:
-            return None
-
-        # Map integer value to option
-        try:
-            return OP_MODE_MAP.get(int(value))
-        except (ValueError, TypeError):
-            return None
-
-    async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
-        # Map option to integer value
-        option_map = {v: k for k, v in OP_MODE_MAP.items()}
-        value = option_map.get(option)
-
-        if value is None:
-            _LOGGER.error("Invalid operation mode option: %s", option)
-            return
-
-        try:
-            await self._api.set_setting(
-                self._device["id"],
-                "op_mode",
-                value,
-            )
-            _LOGGER.info(
-                "Set operation mode to %s on device %s",
-                option,
-                self._device["id"],
-            )
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
-        except (ValueError, QvantumApiError) as err:
-            _LOGGER.error(
-                "Failed to set operation mode: %s",
-                err,
-            )
-
-
-class QvantumManualModeSelect(QvantumEntity, SelectEntity):  # pylint: disable=abstract-method
+class QvantumManualModeSelect(QvantumSelectEntity):
     """Select entity for Manual Mode (off/heating/cooling)."""
 
+    __slots__ = ("_op_mode_is_manual",)
+    _attr_entity_registry_enabled_default = _enabled_by_default("manual_mode")
+    required_values = ("man_mode",)
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
@@ -930,65 +825,48 @@ class QvantumManualModeSelect(QvantumEntity, SelectEntity):  # pylint: disable=a
         """Initialize the select entity."""
         super().__init__(coordinator, device, api)
         self._attr_translation_key = "manual_mode"
-        self._attr_unique_id = f"{device['id']}_manual_mode"
+        self._attr_unique_id = f"{self._device_id}_manual_mode"
         self._attr_icon = "mdi:radiator"
         self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_options = list(MAN_MODE_MAP.values())
-        _def = get_entity_def("manual_mode")
-        self._attr_entity_registry_enabled_default = (
-            _def.enabled_by_default if _def else True
-        )
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected option."""
-        if not self.coordinator.data:
-            return None
+        self._attr_options = MAN_MODE_SELECT_OPTIONS
+        self._op_mode_is_manual = False
 
-        # Try internal_metrics first
-        value = None
-        internal_metrics = self.coordinator.data.get("internal_metrics", {})
-        if internal_metrics:
-            value = internal_metrics.get("man_mode")
-
-        # Fall back to settings
-        if value is None:
-            settings = self.coordinator.data.get("settings", {})
-            if "settings" in settings:
-                for setting in settings["settings"]:
-                    if setting.get("name") == "man_mode":
-                        value = setting.get("value")
-                        break
+    def _compute_current_option(self) -> str | None:
+        """Compute the selected option from coordinator data."""
+        # Try internal_metrics first, then settings
+        value = self._metric_or_setting_value("man_mode")
 
         if value is None:
             return None
 
-        try:
-            return MAN_MODE_MAP.get(int(value))
-        except (ValueError, TypeError):
-            return None
+        return MAN_MODE_MAP.get(value)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        # Reverse map option to value
-        option_map = {v: k for k, v in MAN_MODE_MAP.items()}
-        value = option_map.get(option)
+        value = MAN_MODE_OPTION_MAP.get(option)
 
         if value is None:
             _LOGGER.error("Invalid manual mode option: %s", option)
             return
 
+        # Nothing to write when the option is already selected
+        if option == self.current_option:
+            return
+
         try:
-            await self._api.set_setting(
-                self._device["id"],
+            response = await self._api.set_setting(
+                self._device_id,
                 "man_mode",
                 value,
             )
             _LOGGER.info(
                 "Set manual mode to %s on device %s",
                 option,
-                self._device["id"],
+                self._device_id,
             )
+            # Reflect an applied value now; the refresh below confirms it
+            if command_applied(response):
+                self.coordinator.async_set_optimistic_value("man_mode", value)
             # Request immediate update
             await self.coordinator.async_request_refresh()
         except (ValueError, QvantumApiError) as err:
@@ -997,90 +875,84 @@ class QvantumManualModeSelect(QvantumEntity, SelectEntity):  # pylint: disable=a
                 err,
             )
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        if not self.coordinator.last_update_success:
-            return False
-
+    def _compute_op_mode_is_manual(self) -> bool:
+        """Return whether the operation mode allows manual sub-mode changes."""
         if not self.coordinator.data:
             return False
 
         # Only available when operation mode is Manual (value 1)
-        op_mode_value = None
-        internal_metrics = self.coordinator.data.get("internal_metrics", {})
-        if internal_metrics:
-            op_mode_value = internal_metrics.get("op_mode")
-
-        if op_mode_value is None:
-            settings = self.coordinator.data.get("settings", {})
-            if "settings" in settings:
-                for setting in settings["settings"]:
-                    if setting.get("name") == "op_mode":
-                        op_mode_value = setting.get("value")
-                        break
+        op_mode_value = self._metric_or_setting_value("op_mode")
 
-        try:
-            if op_mode_value is not None and int(op_mode_value) != 1:
-                return False
-        except (ValueError, TypeError):
-            return False
+        # op_mode is normalized to an int by the coordinator
+        return op_mode_value is None or op_mode_value == 1
 
-        return True
+    def _refresh_cached_state(self) -> None:
+        """Recompute the selected option and the operation mode gate."""
+        super()._refresh_cached_state()
+        self._op_mode_is_manual = self._compute_op_mode_is_manual()
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.last_update_success and self._op_mode_is_manual
 
 
-class QvantumDHWOutTempSelect(QvantumEntity, SelectEntity):  # pylint: disable=abstract-method
+class QvantumDHWOutTempSelect(QvantumSelectEntity):
     """Select entity for DHW Out Temperature mode."""
 
+    __slots__ = ("_current_custom_value", "_custom_label")
+    _attr_entity_registry_enabled_default = _enabled_by_default("dhw_out_temp")
+    required_values = ("dhw_outl_temp_5",)
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
         device: dict[str, Any],
-        api: Any,
+        api: QvantumApi,
     ) -> None:
         """Initialize the select entity."""
         super().__init__(coordinator, device, api)
         self._attr_translation_key = "dhw_out_temp"
-        self._attr_unique_id = f"{device['id']}_dhw_out_temp"
+        self._attr_options = list(HOT_WATER_TEMP_OPTIONS)
+        self._attr_unique_id = f"{self._device_id}_dhw_out_temp"
         self._attr_icon = "mdi:thermometer-water"
-        self._current_custom_value = None  # Track custom value
+        self._current_custom_value: int | None = None  # Track custom value
+        self._custom_label: str | None = None  # Option label for the custom value
         self._attr_entity_category = EntityCategory.CONFIG
-        _def = get_entity_def("dhw_out_temp")
-        self._attr_entity_registry_enabled_default = (
-            _def.enabled_by_default if _def else True
-        )
 
-    @property
-    def options(self) -> list[str]:
-        """Return the list of available options."""
-        base_options = list(HOT_WATER_TEMP_MAP.values())
-        if self._current_custom_value is not None:
-            # Add custom option
-            base_options.append(f"Custom ({self._current_custom_value}°C)")
-        return base_options
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected option."""
-        if not self.coordinator.data:
-            return None
-
-        # Try to get value from internal_metrics first, then settings
-        value = None
+    def _set_custom_value(self, value: int | None) -> None:
+        """Track a non-standard device value and rebuild options on change.
 
-        internal_metrics = self.coordinator.data.get("internal_metrics", {})
-        if internal_metrics:
-            value = internal_metrics.get("dhw_outl_temp_5")
+        Args:
+            value: The custom value reported by the device, or None when the
+                device is back on a standard value.
 
-        if value is None:
-            settings = self.coordinator.data.get("settings", {})
-            if "settings" in settings:
-                for setting in settings["settings"]:
-                    if setting.get("name") == "dhw_outl_temp_5":
-                        value = setting.get("value")
-                        break
-
-        # Map value to option using HOT_WATER_TEMP_MAP
+        """
+        if value == self._current_custom_value:
+            return
+        self._current_custom_value = value
+        options = list(HOT_WATER_TEMP_OPTIONS)
+        if value is not None:
+            # Add custom option
+            self._custom_label = f"Custom ({value}°C)"
+            options.append(self._custom_label)
+        else:
+            self._custom_label = None
+        self._attr_options = options
+
+    def _compute_current_option(self) -> str | None:
+        """Compute the selected option from coordinator data."""
+        # Try internal_metrics first, then settings
+        value = self._metric_or_setting_value("dhw_outl_temp_5")
+
+        # Standard values arrive normalized to int and match directly
+        label = HOT_WATER_TEMP_MAP.get(value)
+        if label is not None:
+            # Clear custom value if we're back to a standard value
+            self._set_custom_value(None)
+            return label
+
+        # Map any other value to option using HOT_WATER_TEMP_MAP
         if value is not None:
             try:
                 value_int = int(value)
@@ -1089,46 +961,45 @@ class QvantumDHWOutTempSelect(QvantumEntity, SelectEntity):  # pylint: disable=a
             else:
                 if value_int in HOT_WATER_TEMP_MAP:
                     # Clear custom value if we're back to a standard value
-                    self._current_custom_value = None
+                    self._set_custom_value(None)
                     return HOT_WATER_TEMP_MAP[value_int]
                 # Custom value detected
                 _LOGGER.warning(
                     "DHW outlet temperature has custom value %s°C (device %s). "
                     "Expected one of: %s",
                     value_int,
-                    self._device["id"],
+                    self._device_id,
                     list(HOT_WATER_TEMP_MAP.keys()),
                 )
-                self._current_custom_value = value_int
-                return f"Custom ({value_int}°C)"
+                self._set_custom_value(value_int)
+                return self._custom_label
 
         # Clear custom value and return default
-        self._current_custom_value = None
+        self._set_custom_value(None)
         return HOT_WATER_TEMP_MAP[52]  # Default to normal_52c
 
     async def async_select_option(self, option: str) -> None:
         """Update the current value."""
         # Ignore custom option selection (read-only)
-        if option.startswith("Custom ("):
+        if self._custom_label is not None and option == self._custom_label:
             _LOGGER.warning(
                 "Cannot set custom DHW outlet temperature. Please select a standard option"
             )
             return
 
-        # Reverse map option to value using HOT_WATER_TEMP_MAP
-        value = None
-        for temp, label in HOT_WATER_TEMP_MAP.items():
-            if label == option:
-                value = temp
-                break
+        value = HOT_WATER_TEMP_OPTION_MAP.get(option)
 
         if value is None:
             _LOGGER.error("Invalid DHW out temp option: %s", option)
             return
 
+        # Nothing to write when the option is already selected
+        if option == self.current_option:
+            return
+
         try:
             response = await self._api.set_setting(
-                self._device["id"],
+                self._device_id,
                 "dhw_outl_temp_5",
                 value,
             )
@@ -1136,268 +1007,36 @@ class QvantumDHWOutTempSelect(QvantumEntity, SelectEntity):  # pylint: disable=a
                 "Set DHW outlet temp to %s (%s°C) on device %s",
                 option,
                 value,
-                self._device["id"],
+                self._device_id,
             )
             _LOGGER.debug("API response: %s", response)
 
             # Optimistic update if command was applied
-            if response and (
-                response.get("status") == "APPLIED"
-                or response.get("heatpump_status") == "APPLIED"
-            ):
-                # Update coordinator data immediately
-                if "internal_metrics" in self.coordinator.data:
-                    self.coordinator.data["internal_metrics"]["dhw_outl_temp_5"] = value
-                    self.coordinator.async_set_updated_data(self.coordinator.data)
-                    _LOGGER.debug(
-                        "Optimistically updated dhw_outl_temp_5 to %s in coordinator",
-                        value,
-                    )
-
-            # Clear custom value when setting a standard value
-            self._current_custom_value = None
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
-        except QvantumApiError as err:
-            _LOGGER.error(
-                "Failed to set DHW outlet temp: %s",
-                err,
-            )
-
-
-class QvantumRoomCompFactorSelect(QvantumEntity, SelectEntity):  # pylint: disable=abstract-method
-    """Select entity for Room Compensation Factor."""
-
-    def __init__(
-        self,
-        coordinator: QvantumDataUpdateCoordinator,
-        device: dict[str, Any],
-        api: QvantumApi,
-    ) -> None:
-        """Initialize the select entity."""
-        super().__init__(coordinator, device, api)
-        self._attr_translation_key = "room_comp_factor"
-        self._attr_unique_id = f"{device['id']}_room_comp_factor"
-        self._attr_icon = "mdi:thermometer-lines"
-        self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_options = list(ROOM_COMP_MAP.values())
-        _def = get_entity_def("room_comp_factor")
-        self._attr_entity_registry_enabled_default = (
-            _def.enabled_by_default if _def else True
-        )
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the currently selected option."""
-        if not self.coordinator.data:
-            return None
-
-        value = None
-
-        # Try internal_metrics first
-        internal_metrics = self.coordinator.data.get("internal_metrics", {})
-        if internal_metrics:
-            value = internal_metrics.get("room_comp_factor")
-
-        # Fall back to settings
-        if value is None and (
-            "settings" in self.coordinator.data
-            and "settings" in self.coordinator.data["settings"]
-        ):
-            for setting in self.coordinator.data["settings"]["settings"]:
-                if setting["name"] == "room_comp_factor":
-                    value = setting.get("value")
-                    break
-
-        if value is not None:
-            try:
-                float_value = float(value)
-                return ROOM_COMP_MAP.get(float_value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(
-                    "Could not convert room_comp_factor value %s to float",
+            if command_applied(response):
+                self.coordinator.async_set_optimistic_value("dhw_outl_temp_5", value)
+                _LOGGER.debug(
+                    "Optimistically updated dhw_outl_temp_5 to %s in coordinator",
                     value,
                 )
-        return None
 
-    async def async_select_option(self, option: str) -> None:
-        """Set the room compensation factor."""
-        # Find the numeric value for the selected option
-        value = None
-        for val, label in ROOM_COMP_MAP.items():
-            if label == option:
-                value = val
-                break
-
-        if value is None:
-            _LOGGER.error("Invalid room compensation factor option: %s", option)
-            return
-
-        try:
-            await self._api.set_setting(
-                self._device["id"],
-                "room_comp_factor",
-                value,
-            )
-            _LOGGER.info(
-                "Set room compensation factor to %s (%s) on device %s",
-                option,
-                value,
-                self._device["id"],
-            )
+            # The custom option is cleared by _compute_current_option once
+            # a standard value is reported
             # Request immediate update
             await self.coordinator.async_request_refresh()
         except QvantumApiError as err:
             _LOGGER.error(
-                "Failed to set room compensation factor: %s",
-                err,
-            )
-
-
-class QvantumCurveShiftSelect(QvantumEntity, SelectEntity):  # pylint: disable=abstract-method
-    """Select entity for Heating Curve Shift (indoor temperature offset)."""
-
-    def __init__(
-        self,
-        coordinator: QvantumDataUpdateCoordinator,
-        device: dict[str, Any],
-        api: QvantumApi,
-    ) -> None:
-        """Initialize the select entity."""
-        super().__init__(coordinator, device, api)
-        self._attr_translation_key = "heating_curve_shift"
-        self._attr_unique_id = f"{device['id']}_curve_shift"
-        self._attr_icon = "mdi:chart-bell-curve-cumulative"
-        self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_options = list(CURVE_SHIFT_MAP.values())
-        _def = get_entity_def("heating_curve_shift")
-        self._attr_entity_registry_enabled_default = (
-            _def.enabled_by_default if _def else True
-        )
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the currently selected option."""
-        if (
-            self.coordinator.data
-            and "settings" in self.coordinator.data
-            and "settings" in self.coordinator.data["settings"]
-        ):
-            for setting in self.coordinator.data["settings"]["settings"]:
-                if setting["name"] == "indoor_temperature_offset":
-                    value = setting.get("value")
-                    if value is not None:
-                        try:
-                            # Convert value to int for comparison
-                            int_value = int(value)
-                            return CURVE_SHIFT_MAP.get(int_value)
-                        except (ValueError, TypeError):
-                            _LOGGER.warning(
-                                "Could not convert curve shift value %s to int",
-                                value,
-                            )
-        return None
-
-    async def async_select_option(self, option: str) -> None:
-        """Set the heating curve shift."""
-        # Find the numeric value for the selected option
-        value = None
-        for val, label in CURVE_SHIFT_MAP.items():
-            if label == option:
-                value = val
-                break
-
-        if value is None:
-            _LOGGER.error("Invalid curve shift option: %s", option)
-            return
-
-        try:
-            await self._api.set_setting(
-                self._device["id"],
-                "indoor_temperature_offset",
-                value,
-            )
-            _LOGGER.info(
-                "Set heating curve shift to %s (%s) on device %s",
-                option,
-                value,
-                self._device["id"],
-            )
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
-        except QvantumApiError as err:
-            _LOGGER.error(
-                "Failed to set heating curve shift: %s",
+                "Failed to set DHW outlet temp: %s",
                 err,
             )
 
 
-class QvantumSensorModeSelect(QvantumEntity, SelectEntity):  # pylint: disable=abstract-method
-    """Select entity for Sensor Mode (which sensor controls heat pump operation)."""
-
-    def __init__(
-        self,
-        coordinator: QvantumDataUpdateCoordinator,
-        device: dict[str, Any],
-        api: QvantumApi,
-    ) -> None:
-        """Initialize the select entity."""
-        super().__init__(coordinator, device, api)
-        self._attr_translation_key = "sensor_mode"
-        self._attr_unique_id = f"{device['id']}_sensor_mode"
-        self._attr_icon = "mdi:thermometer-check"
-        self._attr_entity_category = EntityCategory.CONFIG
-        _def = get_entity_def("sensor_mode")
-        self._attr_entity_registry_enabled_default = (
-            _def.enabled_by_default if _def else True
-        )
-        self._attr_options = list(SENSOR_MODE_OPTIONS.values())
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the currently selected option."""
-        if (
-            self.coordinator.data
-            and "settings" in self.coordinator.data
-            and "settings" in self.coordinator.data["settings"]
-        ):
-            for setting in self.coordinator.data["settings"]["settings"]:
-                if setting["name"] == "sensor_mode":
-                    value = setting.get("value")
-                    if value is not None:
-                        # Value is a string like "off", "bt2", "bt3", "btx"
-                        return SENSOR_MODE_OPTIONS.get(value)
-        return None
-
-    async def async_select_option(self, option: str) -> None:
-        """Set the sensor mode."""
-        # Find the string value for the selected option
-        value = None
-        for val, label in SENSOR_MODE_OPTIONS.items():
-            if label == option:
-                value = val
-                break
-
-        if value is None:
-            _LOGGER.error("Invalid sensor mode option: %s", option)
-            return
+# =============================================================================
+# Select classes with bespoke behaviour, created for every device
+# =============================================================================
 
-        try:
-            await self._api.set_setting(
-                self._device["id"],
-                "sensor_mode",
-                value,
-            )
-            _LOGGER.info(
-                "Set sensor mode to %s (%s) on device %s",
-                option,
-                value,
-                self._device["id"],
-            )
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
-        except QvantumApiError as err:
-            _LOGGER.error(
-                "Failed to set sensor mode: %s",
-                err,
-            )
+_SELECT_CLASSES: Final[tuple[type[QvantumSelectEntity], ...]] = (
+    QvantumSmartControlSelect,
+    QvantumDHWPrioritySelect,
+    QvantumDHWOutTempSelect,
+    QvantumManualModeSelect,
+)
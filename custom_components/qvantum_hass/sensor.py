@@ -17,8 +17,11 @@ to provide a clean initial user experience.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from abc import abstractmethod
+from collections import Counter
+from collections.abc import Callable, Collection
 from datetime import UTC, datetime
+from functools import lru_cache
 import logging
 from typing import Any, Final
 
@@ -39,8 +42,9 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfVolumeFlowRate,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 
 from .coordinator import QvantumDataUpdateCoordinator
 from .entity import QvantumEntity
@@ -86,6 +90,9 @@ BT4_CONFIG_MAP: Final = {
     1: "sg_ready_b",
 }
 
+# Severities listed in the active alarms summary, most severe first
+ALARM_SEVERITY_ORDER: Final = ("CRITICAL", "SEVERE", "WARNING", "INFO")
+
 
 # =============================================================================
 # Entity definitions for this platform
@@ -603,6 +610,120 @@ _ENUM_VALUE_MAPS: dict[str, dict[int, str]] = {
     "btxconfig": BTX_CONFIG_MAP,
     "bt4config": BT4_CONFIG_MAP,
 }
+_ENUM_VALUE_OPTIONS: Final[dict[str, list[str]]] = {
+    key: list(value_map.values()) for key, value_map in _ENUM_VALUE_MAPS.items()
+}
+
+# =============================================================================
+# Internal metric sensor configuration, resolved once per unit / metric key.
+# =============================================================================
+
+# unit -> (device class, native unit, state class); a None device class
+# leaves the entity without one
+_METRIC_UNIT_CONFIG: Final[
+    dict[str, tuple[SensorDeviceClass | None, str, SensorStateClass]]
+] = {
+    "°C": (
+        SensorDeviceClass.TEMPERATURE,
+        UnitOfTemperature.CELSIUS,
+        SensorStateClass.MEASUREMENT,
+    ),
+    "%": (None, PERCENTAGE, SensorStateClass.MEASUREMENT),
+    "bar": (
+        SensorDeviceClass.PRESSURE,
+        UnitOfPressure.BAR,
+        SensorStateClass.MEASUREMENT,
+    ),
+    "Hz": (
+        SensorDeviceClass.FREQUENCY,
+        UnitOfFrequency.HERTZ,
+        SensorStateClass.MEASUREMENT,
+    ),
+    "L/min": (
+        SensorDeviceClass.VOLUME_FLOW_RATE,
+        UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
+        SensorStateClass.MEASUREMENT,
+    ),
+    "W": (SensorDeviceClass.POWER, UnitOfPower.WATT, SensorStateClass.MEASUREMENT),
+    "kW": (
+        SensorDeviceClass.POWER,
+        UnitOfPower.KILO_WATT,
+        SensorStateClass.MEASUREMENT,
+    ),
+    "kWh": (
+        SensorDeviceClass.ENERGY,
+        UnitOfEnergy.KILO_WATT_HOUR,
+        SensorStateClass.TOTAL_INCREASING,
+    ),
+    "A": (
+        SensorDeviceClass.CURRENT,
+        UnitOfElectricCurrent.AMPERE,
+        SensorStateClass.MEASUREMENT,
+    ),
+}
+
+# Internal metrics with fixed state values, keyed by metric name
+_METRIC_ENUM_MAPS: Final[dict[str, dict[int, str]]] = {
+    "hp_status": HP_STATUS_MAP,
+    "op_mode_sensor": OP_MODE_SENSOR_MAP,
+    "guide_he": GUIDE_HE_MAP,
+}
+_METRIC_ENUM_OPTIONS: Final[dict[str, list[str]]] = {
+    key: list(value_map.values()) for key, value_map in _METRIC_ENUM_MAPS.items()
+}
+
+
+def _nested_get(data: dict[str, Any] | None, *keys: str) -> Any:
+    """Return a nested value from coordinator data.
+
+    Args:
+        data: Coordinator data dict
+        keys: Keys to follow, outermost first
+
+    Returns:
+        The nested value, or None if any level is missing.
+
+    """
+    value: Any = data
+    for key in keys:
+        if not value:
+            return None
+        value = value.get(key)
+    return value
+
+
+def _is_reported(values: Collection[str] | None, key: str) -> bool:
+    """Return whether the device reports a value for a sensor.
+
+    Args:
+        values: Keys the device reported; None or empty if not known yet,
+            e.g. after a partial first fetch
+        key: API key of the sensor's value
+
+    Returns:
+        True if the key was reported or the reported keys are unknown.
+
+    """
+    return not values or key in values
+
+
+@lru_cache(maxsize=64)
+def _parse_iso_timestamp(value: str) -> datetime | None:
+    """Parse an ISO 8601 timestamp string.
+
+    Timestamp sensors re-read the same few strings on every state update, so
+    results are memoized and each distinct value is parsed only once. Parsing
+    goes through Home Assistant's ciso8601-backed parser, which accepts a
+    trailing "Z" and falls back to a regex parser for unusual inputs.
+
+    Args:
+        value: ISO 8601 timestamp string from the API
+
+    Returns:
+        The parsed datetime, or None if the string is not a valid timestamp.
+
+    """
+    return dt_util.parse_datetime(value)
 
 
 def _create_internal_metric(
@@ -620,8 +741,13 @@ def _create_settings_enum(
     entity_def: QvantumEntityDef,
 ) -> QvantumSettingsEnumSensor:
     """Create a settings enum sensor (e.g., btxconfig, bt4config)."""
-    value_map = _ENUM_VALUE_MAPS[entity_def.key]
-    return QvantumSettingsEnumSensor(coordinator, device, entity_def.key, value_map)
+    return QvantumSettingsEnumSensor(
+        coordinator,
+        device,
+        entity_def.key,
+        _ENUM_VALUE_MAPS[entity_def.key],
+        _ENUM_VALUE_OPTIONS[entity_def.key],
+    )
 
 
 def _create_settings_timestamp(
@@ -726,6 +852,19 @@ _SENSOR_FACTORIES: dict[
     "access_expires": _create_access_expires,
 }
 
+# Each sensor definition paired with its factory, resolved once at import
+_SENSOR_BUILDERS: Final = tuple(
+    (entity_def, _SENSOR_FACTORIES[entity_def.entity_type])
+    for entity_def in ENTITY_DEFS
+)
+
+# Where each sensor type's values live in coordinator data, used to skip
+# sensors the device does not report
+_REPORTED_VALUES_PATHS: Final[dict[str | None, tuple[str, ...]]] = {
+    None: ("internal_metrics",),
+    "metadata": ("status", "device_metadata"),
+}
+
 
 async def async_setup_entry(
     _hass: HomeAssistant,
@@ -736,7 +875,8 @@ async def async_setup_entry(
 
     Iterates all sensor entity definitions and uses the factory registry
     to create the appropriate sensor class for each. Fast-polling metrics
-    use a separate coordinator with 5-second updates.
+    use a separate coordinator with 5-second updates. Sensors for values the
+    device does not report are skipped.
 
     Args:
         hass: Home Assistant instance
@@ -755,12 +895,20 @@ async def async_setup_entry(
         coordinator = coordinators[device_id]
         fast_coordinator = fast_coordinators[device_id]
 
-        for entity_def in ENTITY_DEFS:
-            selected_coordinator = (
+        for entity_def, factory in _SENSOR_BUILDERS:
+            sensor_coordinator = (
                 fast_coordinator if entity_def.fast_polling else coordinator
             )
-            factory = _SENSOR_FACTORIES[entity_def.entity_type]
-            entities.append(factory(selected_coordinator, device, entity_def))
+
+            # Skip sensors for values the device does not report
+            reported_path = _REPORTED_VALUES_PATHS.get(entity_def.entity_type)
+            if reported_path is not None and not _is_reported(
+                _nested_get(sensor_coordinator.data, *reported_path),
+                entity_def.api_key or entity_def.key,
+            ):
+                continue
+
+            entities.append(factory(sensor_coordinator, device, entity_def))
 
     async_add_entities(entities)
 
@@ -768,6 +916,8 @@ async def async_setup_entry(
 class QvantumSensorBase(QvantumEntity, SensorEntity):
     """Base class for Qvantum sensors."""
 
+    __slots__ = ("_sensor_type",)
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
@@ -779,12 +929,14 @@ class QvantumSensorBase(QvantumEntity, SensorEntity):
         super().__init__(coordinator, device, None)  # API not needed for sensors
         self._sensor_type = sensor_type
         self._attr_translation_key = translation_key
-        self._attr_unique_id = f"{device['id']}_{sensor_type}"
+        self._attr_unique_id = f"{self._device_id}_{sensor_type}"
 
 
 class QvantumInternalMetricSensor(QvantumSensorBase):
     """Sensor for Qvantum internal metrics."""
 
+    __slots__ = ("_metric_name", "_value_map")
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
@@ -805,89 +957,54 @@ class QvantumInternalMetricSensor(QvantumSensorBase):
         self._attr_entity_category = entity_def.entity_category
 
         # Configure enum sensors (sensors with fixed state values)
-        if entity_def.key == "hp_status":
-            self._attr_device_class = SensorDeviceClass.ENUM
-            self._attr_options = list(HP_STATUS_MAP.values())
-        elif entity_def.key == "op_mode_sensor":
+        self._value_map = _METRIC_ENUM_MAPS.get(entity_def.key)
+        if self._value_map is not None:
             self._attr_device_class = SensorDeviceClass.ENUM
-            self._attr_options = list(OP_MODE_SENSOR_MAP.values())
-        elif entity_def.key == "guide_he":
-            self._attr_device_class = SensorDeviceClass.ENUM
-            self._attr_options = list(GUIDE_HE_MAP.values())
+            self._attr_options = _METRIC_ENUM_OPTIONS[entity_def.key]
 
-        # Only set state_class for numeric sensors (those with a unit)
+        # Set unit, device class and state class based on unit string; only
+        # numeric sensors (those with a unit) get a state_class
         unit = entity_def.unit
         if unit is not None:
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-
-        # Set unit and device class based on unit string
-        if unit == "°C":
-            self._attr_device_class = SensorDeviceClass.TEMPERATURE
-            self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        elif unit == "%":
-            self._attr_native_unit_of_measurement = PERCENTAGE
-        elif unit == "bar":
-            self._attr_device_class = SensorDeviceClass.PRESSURE
-            self._attr_native_unit_of_measurement = UnitOfPressure.BAR
-        elif unit == "Hz":
-            self._attr_device_class = SensorDeviceClass.FREQUENCY
-            self._attr_native_unit_of_measurement = UnitOfFrequency.HERTZ
-        elif unit == "L/min":
-            self._attr_device_class = SensorDeviceClass.VOLUME_FLOW_RATE
-            self._attr_native_unit_of_measurement = (
-                UnitOfVolumeFlowRate.LITERS_PER_MINUTE
-            )
-        elif unit == "W":
-            self._attr_device_class = SensorDeviceClass.POWER
-            self._attr_native_unit_of_measurement = UnitOfPower.WATT
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif unit == "kW":
-            self._attr_device_class = SensorDeviceClass.POWER
-            self._attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif unit == "kWh":
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        elif unit == "A":
-            self._attr_device_class = SensorDeviceClass.CURRENT
-            self._attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif unit is not None:
-            # Custom units (rpm, minutes, L) — keep MEASUREMENT state_class
-            self._attr_native_unit_of_measurement = unit
+            unit_config = _METRIC_UNIT_CONFIG.get(unit)
+            if unit_config is None:
+                # Custom units (rpm, minutes, L) — keep MEASUREMENT state_class
+                self._attr_native_unit_of_measurement = unit
+                self._attr_state_class = SensorStateClass.MEASUREMENT
+            else:
+                device_class, native_unit, state_class = unit_config
+                if device_class is not None:
+                    self._attr_device_class = device_class
+                self._attr_native_unit_of_measurement = native_unit
+                self._attr_state_class = state_class
 
     @property
     def native_value(self) -> str | int | float | None:
         """Return the state of the sensor."""
-        if self.coordinator.data and "internal_metrics" in self.coordinator.data:
-            values = self.coordinator.data["internal_metrics"]
-            raw_value = values.get(self._metric_name)
+        raw_value = self._metric_value(self._metric_name)
 
-            # Map status values to human-readable strings
-            if self._metric_name == "hp_status" and raw_value is not None:
-                try:
-                    return HP_STATUS_MAP.get(int(raw_value), raw_value)
-                except (ValueError, TypeError):
-                    return raw_value
-            if self._metric_name == "op_mode_sensor" and raw_value is not None:
-                try:
-                    return OP_MODE_SENSOR_MAP.get(int(raw_value), raw_value)
-                except (ValueError, TypeError):
-                    return raw_value
-            if self._metric_name == "guide_he" and raw_value is not None:
-                try:
-                    return GUIDE_HE_MAP.get(int(raw_value), raw_value)
-                except (ValueError, TypeError):
-                    return raw_value
+        # Map status values to human-readable strings; the coordinator
+        # normalizes them to int, so try a direct lookup before converting
+        value_map = self._value_map
+        if value_map is not None and raw_value is not None:
+            label = value_map.get(raw_value)
+            if label is not None:
+                return label
+            try:
+                return value_map.get(int(raw_value), raw_value)
+            except (ValueError, TypeError):
+                return raw_value
 
-            return raw_value
-        return None
+        return raw_value
 
 
 class QvantumMetadataSensor(QvantumSensorBase):
     """Sensor for device metadata."""
 
+    __slots__ = ("_metadata_key",)
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
@@ -898,24 +1015,22 @@ class QvantumMetadataSensor(QvantumSensorBase):
         """Initialize the sensor."""
         super().__init__(coordinator, device, f"metadata_{metadata_key}", name)
         self._metadata_key = metadata_key
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        if (
-            self.coordinator.data
-            and "status" in self.coordinator.data
-            and "device_metadata" in self.coordinator.data["status"]
-        ):
-            metadata = self.coordinator.data["status"]["device_metadata"]
-            return metadata.get(self._metadata_key)
-        return None
+        metadata = _nested_get(self.coordinator.data, "status", "device_metadata")
+        return metadata.get(self._metadata_key) if metadata else None
 
 
 class QvantumServiceAccessUntilSensor(QvantumSensorBase):
     """Sensor for service access expiration time."""
 
+    __slots__ = ()
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
@@ -925,31 +1040,64 @@ class QvantumServiceAccessUntilSensor(QvantumSensorBase):
         super().__init__(
             coordinator, device, "service_access_until", "service_access_until"
         )
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     @property
     def native_value(self) -> datetime | None:
         """Return the state of the sensor."""
-        if (
-            self.coordinator.data
-            and "status" in self.coordinator.data
-            and "service_access" in self.coordinator.data["status"]
-        ):
-            service_access = self.coordinator.data["status"]["service_access"]
-            until = service_access.get("until")
-            if until:
-                try:
-                    # Parse ISO format timestamp to datetime
-                    return datetime.fromisoformat(until)
-                except (ValueError, AttributeError):
-                    return None
+        until = _nested_get(self.coordinator.data, "status", "service_access", "until")
+        if until:
+            # Parse ISO format timestamp to datetime
+            return _parse_iso_timestamp(until)
         return None
 
 
-class QvantumAlarmCountSensor(QvantumSensorBase):
+class QvantumDerivedStateSensor(QvantumSensorBase):
+    """Base class for sensors whose state is derived from coordinator data.
+
+    The state and attributes are computed once per coordinator update and
+    stored in ``_attr_native_value`` / ``_attr_extra_state_attributes``, so
+    repeated state reads between updates are plain attribute lookups.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        """Compute the sensor state from coordinator data.
+
+        Returns:
+            Tuple of (native value, extra state attributes).
+
+        """
+
+    def _refresh_cached_state(self) -> None:
+        """Recompute the state and attributes from coordinator data."""
+        (
+            self._attr_native_value,
+            self._attr_extra_state_attributes,
+        ) = self._compute_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial state when the entity is added."""
+        await super().async_added_to_hass()
+        self._refresh_cached_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the cached state before writing it to Home Assistant."""
+        self._refresh_cached_state()
+        super()._handle_coordinator_update()
+
+
+class QvantumAlarmCountSensor(QvantumDerivedStateSensor):
     """Sensor for total alarm count."""
 
+    __slots__ = ()
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = None
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
@@ -957,48 +1105,28 @@ class QvantumAlarmCountSensor(QvantumSensorBase):
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, device, "alarm_count", "alarm_count")
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_native_unit_of_measurement = None
-        self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def native_value(self) -> int:
-        """Return the number of active alarms."""
-        if (
-            self.coordinator.data
-            and "alarms" in self.coordinator.data
-            and "alarms" in self.coordinator.data["alarms"]
-        ):
-            alarms = self.coordinator.data["alarms"]["alarms"]
-            active_alarms = [a for a in alarms if a.get("is_active", False)]
-            return len(active_alarms)
-        return 0
+    def _compute_state(self) -> tuple[int, dict[str, Any]]:
+        """Return the number of active alarms and the alarm totals."""
+        view = _nested_get(self.coordinator.data, "alarms_view")
+        if view is not None:
+            active = len(view["active"])
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        if (
-            self.coordinator.data
-            and "alarms" in self.coordinator.data
-            and "alarms" in self.coordinator.data["alarms"]
-        ):
-            alarms = self.coordinator.data["alarms"]["alarms"]
-            total = len(alarms)
-            active = [a for a in alarms if a.get("is_active", False)]
-
-            return {
-                "total_alarms": total,
-                "active_alarms": len(active),
-                "acknowledged_alarms": len(
-                    [a for a in alarms if a.get("is_acknowledged", False)]
-                ),
+            return active, {
+                "total_alarms": view["total"],
+                "active_alarms": active,
+                "acknowledged_alarms": view["acknowledged"],
             }
-        return {}
+        return 0, {}
 
 
-class QvantumActiveAlarmsSensor(QvantumSensorBase):
+class QvantumActiveAlarmsSensor(QvantumDerivedStateSensor):
     """Sensor for active alarm details."""
 
+    __slots__ = ()
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
@@ -1006,146 +1134,148 @@ class QvantumActiveAlarmsSensor(QvantumSensorBase):
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, device, "active_alarms", "active_alarms")
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    @property
-    def native_value(self) -> str | None:
-        """Return a summary of active alarms."""
-        if (
-            self.coordinator.data
-            and "alarms" in self.coordinator.data
-            and "alarms" in self.coordinator.data["alarms"]
-        ):
-            alarms = self.coordinator.data["alarms"]["alarms"]
-            active_alarms = [a for a in alarms if a.get("is_active", False)]
+    def _compute_state(self) -> tuple[str | None, dict[str, Any]]:
+        """Return a summary of active alarms and their details."""
+        view = _nested_get(self.coordinator.data, "alarms_view")
+        if view is not None:
+            active_alarms = view["active"]
 
+            # Most devices have no active alarms, so skip the summary work
             if not active_alarms:
-                return "none"
+                return "none", {"alarm_list": []}
+
+            attrs = {
+                "alarm_list": [
+                    {
+                        "code": alarm.get("code"),
+                        "description": alarm.get("description"),
+                        "severity": alarm.get("severity"),
+                        "category": alarm.get("type"),
+                        "triggered": alarm.get("triggered_timestamp"),
+                        "acknowledged": alarm.get("is_acknowledged", False),
+                    }
+                    for alarm in active_alarms
+                ]
+            }
 
             # Return summary of active alarms
-            severities = {}
-            for alarm in active_alarms:
-                severity = alarm.get("severity", "UNKNOWN")
-                severities[severity] = severities.get(severity, 0) + 1
+            severities = Counter(
+                alarm.get("severity", "UNKNOWN") for alarm in active_alarms
+            )
 
             parts = [
                 f"{severities[severity]} {severity}"
-                for severity in ["CRITICAL", "SEVERE", "WARNING", "INFO"]
+                for severity in ALARM_SEVERITY_ORDER
                 if severity in severities
             ]
 
-            return ", ".join(parts) if parts else f"{len(active_alarms)} active"
-        return None
+            summary = ", ".join(parts) if parts else f"{len(active_alarms)} active"
+            return summary, attrs
+        return None, {}
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return detailed alarm information."""
-        if (
-            self.coordinator.data
-            and "alarms" in self.coordinator.data
-            and "alarms" in self.coordinator.data["alarms"]
-        ):
-            alarms = self.coordinator.data["alarms"]["alarms"]
-            active_alarms = [a for a in alarms if a.get("is_active", False)]
-
-            attrs = {"alarm_list": []}
-
-            for alarm in active_alarms:
-                alarm_info = {
-                    "code": alarm.get("code"),
-                    "description": alarm.get("description"),
-                    "severity": alarm.get("severity"),
-                    "category": alarm.get("type"),
-                    "triggered": alarm.get("triggered_timestamp"),
-                    "acknowledged": alarm.get("is_acknowledged", False),
-                }
-                attrs["alarm_list"].append(alarm_info)
-
-            return attrs
-        return {}
-
-
-class QvantumAccessLevelSensor(QvantumEntity, SensorEntity):
-    """Sensor showing the current access level for the device."""
+
+class QvantumAccessSensorBase(QvantumDerivedStateSensor):
+    """Base class for sensors reading the device access level data.
+
+    Availability depends on the access level data rather than on device
+    connectivity, and is evaluated once per coordinator update together
+    with the state.
+    """
+
+    __slots__ = ("_access_data_available",)
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
         device: dict[str, Any],
+        sensor_type: str,
     ) -> None:
-        """Initialize the access level sensor."""
-        super().__init__(coordinator, device, None)
-        self._attr_translation_key = "access_level"
-        self._attr_unique_id = f"{device['id']}_access_level"
-        self._attr_icon = "mdi:security"
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        """Initialize the access sensor."""
+        super().__init__(coordinator, device, sensor_type, sensor_type)
+        self._access_data_available = False
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the current write access level."""
-        if self.coordinator.data and "access_level" in self.coordinator.data:
-            return self.coordinator.data["access_level"].get("writeAccessLevel")
-        return None
+    def _has_access_data(self, access_data: dict[str, Any]) -> bool:
+        """Return whether the access level data carries this sensor's value.
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional access level information."""
-        if self.coordinator.data and "access_level" in self.coordinator.data:
-            access_data = self.coordinator.data["access_level"]
-            return {
-                "read_access_level": access_data.get("readAccessLevel"),
-                "has_service_access": access_data.get("writeAccessLevel", 0) >= 20,
-            }
-        return {}
+        Args:
+            access_data: Access level data from the coordinator
+
+        Returns:
+            True if the sensor has a value to show.
+
+        """
+        return True
+
+    def _refresh_cached_state(self) -> None:
+        """Recompute the state, attributes and availability."""
+        super()._refresh_cached_state()
+        access_data = _nested_get(self.coordinator.data, "access_level")
+        self._access_data_available = access_data is not None and self._has_access_data(
+            access_data
+        )
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and "access_level" in self.coordinator.data
-        )
+        return self.coordinator.last_update_success and self._access_data_available
+
+
+class QvantumAccessLevelSensor(QvantumAccessSensorBase):
+    """Sensor showing the current access level for the device."""
+
+    __slots__ = ()
+
+    _attr_icon = "mdi:security"
 
+    def __init__(
+        self,
+        coordinator: QvantumDataUpdateCoordinator,
+        device: dict[str, Any],
+    ) -> None:
+        """Initialize the access level sensor."""
+        super().__init__(coordinator, device, "access_level")
 
-class QvantumAccessExpireSensor(QvantumEntity, SensorEntity):
+    def _compute_state(self) -> tuple[int | None, dict[str, Any]]:
+        """Return the write access level and additional access information."""
+        access_data = _nested_get(self.coordinator.data, "access_level")
+        if access_data is None:
+            return None, {}
+        return access_data.get("writeAccessLevel"), {
+            "read_access_level": access_data.get("readAccessLevel"),
+            "has_service_access": access_data.get("writeAccessLevel", 0) >= 20,
+        }
+
+
+class QvantumAccessExpireSensor(QvantumAccessSensorBase):
     """Sensor showing when the elevated access expires."""
 
+    __slots__ = ()
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:clock-alert"
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
         device: dict[str, Any],
     ) -> None:
         """Initialize the access expiration sensor."""
-        super().__init__(coordinator, device, None)
-        self._attr_translation_key = "access_expires_at"
-        self._attr_unique_id = f"{device['id']}_access_expires_at"
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
-        self._attr_icon = "mdi:clock-alert"
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        super().__init__(coordinator, device, "access_expires_at")
 
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the access expiration timestamp."""
-        if self.coordinator.data and "access_level" in self.coordinator.data:
-            expires_at_str = self.coordinator.data["access_level"].get("expiresAt")
-            if expires_at_str:
-                try:
-                    # Parse ISO format timestamp
-                    return datetime.fromisoformat(expires_at_str)
-                except (ValueError, AttributeError):
-                    return None
-        return None
+    def _has_access_data(self, access_data: dict[str, Any]) -> bool:
+        """Return whether an access expiration time is set."""
+        return access_data.get("expiresAt") is not None
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and "access_level" in self.coordinator.data
-            and self.coordinator.data["access_level"].get("expiresAt") is not None
-        )
+    def _compute_state(self) -> tuple[datetime | None, dict[str, Any]]:
+        """Return the access expiration timestamp."""
+        expires_at_str = _nested_get(self.coordinator.data, "access_level", "expiresAt")
+        if expires_at_str:
+            # Parse ISO format timestamp
+            return _parse_iso_timestamp(expires_at_str), {}
+        return None, {}
 
 
 class QvantumSettingsEnumSensor(QvantumEntity, SensorEntity):
@@ -1155,37 +1285,55 @@ class QvantumSettingsEnumSensor(QvantumEntity, SensorEntity):
     API endpoint, not the settings endpoint.
     """
 
+    __slots__ = ("_setting_name", "_value_map")
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
         device: dict[str, Any],
         setting_name: str,
         value_map: dict[int, str],
+        options: list[str] | None = None,
     ) -> None:
-        """Initialize the settings enum sensor."""
+        """Initialize the settings enum sensor.
+
+        Args:
+            coordinator: Data update coordinator instance.
+            device: Device dictionary containing id, serial, model, etc.
+            setting_name: Internal metric name read by the sensor.
+            value_map: Maps raw values to option strings.
+            options: Shared option list for ``value_map``; built from the map
+                when not supplied.
+        """
         super().__init__(coordinator, device, None)
         self._setting_name = setting_name
         self._value_map = value_map
         self._attr_translation_key = setting_name
-        self._attr_unique_id = f"{device['id']}_{setting_name}"
-        self._attr_device_class = SensorDeviceClass.ENUM
-        self._attr_options = list(value_map.values())
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_unique_id = f"{self._device_id}_{setting_name}"
+        self._attr_options = (
+            options if options is not None else list(value_map.values())
+        )
 
     @property
     def native_value(self) -> str | None:
         """Return the current value mapped to a human-readable string."""
-        if self.coordinator.data and "internal_metrics" in self.coordinator.data:
-            value = self.coordinator.data["internal_metrics"].get(self._setting_name)
-            if value is not None:
-                try:
-                    return self._value_map.get(int(value))
-                except (ValueError, TypeError):
-                    _LOGGER.warning(
-                        "Could not convert %s value %s to int",
-                        self._setting_name,
-                        value,
-                    )
+        value = self._metric_value(self._setting_name)
+        if value is not None:
+            # Normalized to int by the coordinator; convert only on a miss
+            label = self._value_map.get(value)
+            if label is not None:
+                return label
+            try:
+                return self._value_map.get(int(value))
+            except (ValueError, TypeError):
+                _LOGGER.warning(
+                    "Could not convert %s value %s to int",
+                    self._setting_name,
+                    value,
+                )
         return None
 
 
@@ -1196,6 +1344,11 @@ class QvantumSettingsTimestampSensor(QvantumEntity, SensorEntity):
     API endpoint, not the settings endpoint.
     """
 
+    __slots__ = ("_setting_name",)
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
@@ -1206,36 +1359,37 @@ class QvantumSettingsTimestampSensor(QvantumEntity, SensorEntity):
         super().__init__(coordinator, device, None)
         self._setting_name = setting_name
         self._attr_translation_key = setting_name
-        self._attr_unique_id = f"{device['id']}_{setting_name}"
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_unique_id = f"{self._device_id}_{setting_name}"
 
     @property
     def available(self) -> bool:
         """Return False when value is 0 or empty string (no date set)."""
-        if self.coordinator.data and "internal_metrics" in self.coordinator.data:
-            value = self.coordinator.data["internal_metrics"].get(self._setting_name)
-            if value in {0, ""}:
-                return False
+        value = self._metric_value(self._setting_name)
+        if value in {0, ""}:
+            return False
         return self.coordinator.last_update_success
 
     @property
     def native_value(self) -> datetime | None:
         """Return the timestamp value."""
-        if self.coordinator.data and "internal_metrics" in self.coordinator.data:
-            value = self.coordinator.data["internal_metrics"].get(self._setting_name)
-            if value is not None and value not in {"", 0}:
+        value = self._metric_value(self._setting_name)
+        if value is not None and value not in {"", 0}:
+            parsed: datetime | None = None
+            if isinstance(value, (int, float)):
                 try:
-                    if isinstance(value, (int, float)):
-                        # API returns Unix epoch seconds
-                        return datetime.fromtimestamp(value, tz=UTC)
-                    return datetime.fromisoformat(str(value))
-                except (ValueError, AttributeError, OSError):
-                    _LOGGER.warning(
-                        "Could not parse %s timestamp: %s",
-                        self._setting_name,
-                        value,
-                    )
+                    # API returns Unix epoch seconds
+                    parsed = datetime.fromtimestamp(value, tz=UTC)
+                except (ValueError, OverflowError, OSError):
+                    pass
+            else:
+                parsed = _parse_iso_timestamp(str(value))
+            if parsed is not None:
+                return parsed
+            _LOGGER.warning(
+                "Could not parse %s timestamp: %s",
+                self._setting_name,
+                value,
+            )
         return None
 
 
@@ -1246,6 +1400,10 @@ class QvantumSettingsTextSensor(QvantumEntity, SensorEntity):
     API endpoint, not the settings endpoint.
     """
 
+    __slots__ = ("_setting_name",)
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
@@ -1256,14 +1414,12 @@ class QvantumSettingsTextSensor(QvantumEntity, SensorEntity):
         super().__init__(coordinator, device, None)
         self._setting_name = setting_name
         self._attr_translation_key = setting_name
-        self._attr_unique_id = f"{device['id']}_{setting_name}"
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_unique_id = f"{self._device_id}_{setting_name}"
 
     @property
     def native_value(self) -> str | None:
         """Return the text value."""
-        if self.coordinator.data and "internal_metrics" in self.coordinator.data:
-            value = self.coordinator.data["internal_metrics"].get(self._setting_name)
-            if value is not None:
-                return str(value)
+        value = self._metric_value(self._setting_name)
+        if value is not None:
+            return str(value)
         return None
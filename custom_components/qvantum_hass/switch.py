@@ -15,7 +15,7 @@ Many are disabled by default to reduce clutter for typical users.
 from __future__ import annotations
 
 import logging
-from typing import Any, Final
+from typing import Any, ClassVar, Final
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
@@ -26,8 +26,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .api import QvantumApiError
 from .const import DOMAIN
-from .coordinator import QvantumDataUpdateCoordinator
-from .entity import QvantumEntity
+from .coordinator import QvantumDataUpdateCoordinator, coerce_bool
+from .entity import QvantumEntity, command_applied
 from .models import EntitySource, QvantumEntityDef
 
 PARALLEL_UPDATES = 0
@@ -106,6 +106,8 @@ ENTITY_DEFS: Final[list[QvantumEntityDef]] = [
     ),
 ]
 
+_ENTITY_DEFS_BY_KEY: Final = {e.key: e for e in ENTITY_DEFS}
+
 _LOGGER = logging.getLogger(__name__)
 
 # Icons for manual operation switches, keyed by api_key.
@@ -118,7 +120,7 @@ _MANUAL_OP_ICONS: dict[str, str] = {
 
 def get_entity_def(key: str) -> QvantumEntityDef | None:
     """Look up an entity definition by key within this platform's entity definitions."""
-    return next((e for e in ENTITY_DEFS if e.key == key), None)
+    return _ENTITY_DEFS_BY_KEY.get(key)
 
 
 def _create_switch_entity(
@@ -161,9 +163,111 @@ async def async_setup_entry(
     )
 
 
-class QvantumSwitchEntity(QvantumEntity, SwitchEntity):  # pylint: disable=abstract-method
+class QvantumSettingSwitch(QvantumEntity, SwitchEntity):  # pylint: disable=abstract-method
+    """Base class for switches that write a single device setting.
+
+    Once a write is accepted, the new value is written to the coordinator's
+    cached data so the state shows immediately instead of snapping back.
+    The cache is only touched after the call succeeds, so a failed write
+    has nothing to roll back. A write then requests a debounced refresh
+    rather than an immediate poll: toggles made in quick succession share
+    one fetch, which confirms the value or corrects a write the device did
+    not apply.
+    """
+
+    __slots__ = ("_setting_name",)
+
+    def __init__(
+        self,
+        coordinator: QvantumDataUpdateCoordinator,
+        device: dict[str, Any],
+        api: Any,
+        setting_name: str,
+    ) -> None:
+        """Initialize the setting switch.
+
+        Args:
+            coordinator: Data update coordinator instance.
+            device: Device dictionary containing id, serial, model, etc.
+            api: Qvantum API instance.
+            setting_name: Name of the setting the switch writes.
+        """
+        super().__init__(coordinator, device, api)
+        self._setting_name = setting_name
+
+    def _refresh_cached_state(self) -> None:
+        """Recompute state derived from coordinator data.
+
+        Subclasses override this to cache values that only change when the
+        coordinator data does, instead of resolving them on every read.
+        """
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial cached state when the entity is added."""
+        await super().async_added_to_hass()
+        self._refresh_cached_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the cached state before writing it to Home Assistant."""
+        # A failed update leaves the entity unavailable; keep the last
+        # cached state until data arrives again
+        if self.coordinator.last_update_success:
+            self._refresh_cached_state()
+        super()._handle_coordinator_update()
+
+    async def _async_set_setting(self, value: Any) -> dict[str, Any]:
+        """Write the setting, reflecting an applied value right away.
+
+        Args:
+            value: Value to write, in the form the coordinator stores it.
+
+        Returns:
+            The API response.
+
+        Raises:
+            QvantumApiError: If the write fails; the cached data is untouched.
+
+        """
+        response = await self._async_write_value(value)
+        # Reflect an accepted value now; the refresh below confirms it
+        if self._write_accepted(response):
+            self.coordinator.async_set_optimistic_value(self._setting_name, value)
+        await self.coordinator.async_request_refresh()
+        return response
+
+    def _write_accepted(self, response: dict[str, Any] | None) -> bool:
+        """Return whether a write response shows the new value was accepted.
+
+        Args:
+            response: Response returned by ``_async_write_value``.
+
+        Returns:
+            True if the value should be reflected before the refresh.
+
+        """
+        return command_applied(response)
+
+    async def _async_write_value(self, value: Any) -> dict[str, Any]:
+        """Send the new value to the device.
+
+        Args:
+            value: Value to write.
+
+        Returns:
+            The API response.
+
+        """
+        # Routed through the coordinator so writes from switches toggled
+        # together reach the device as one command
+        return await self.coordinator.async_schedule_setting(self._setting_name, value)
+
+
+class QvantumSwitchEntity(QvantumSettingSwitch):
     """Switch entity for Qvantum settings (reads from settings API)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
@@ -172,50 +276,29 @@ class QvantumSwitchEntity(QvantumEntity, SwitchEntity):  # pylint: disable=abstr
         entity_def: QvantumEntityDef,
     ) -> None:
         """Initialize the switch entity from an entity definition."""
-        super().__init__(coordinator, device, api)
-        self._setting_name = entity_def.api_key or entity_def.key
+        super().__init__(
+            coordinator, device, api, entity_def.api_key or entity_def.key
+        )
         self._attr_translation_key = entity_def.key
-        self._attr_unique_id = f"{device['id']}_{entity_def.key}"
+        self._attr_unique_id = f"{self._device_id}_{entity_def.key}"
         self._attr_entity_registry_enabled_default = entity_def.enabled_by_default
         self._attr_entity_category = entity_def.entity_category
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        if (
-            self.coordinator.data
-            and "settings" in self.coordinator.data
-            and "settings" in self.coordinator.data["settings"]
-        ):
-            for setting in self.coordinator.data["settings"]["settings"]:
-                if setting["name"] == self._setting_name:
-                    value = setting.get("value")
-                    if value is not None:
-                        # Handle different value representations
-                        if isinstance(value, bool):
-                            return value
-                        if isinstance(value, str):
-                            return value.lower() in ("on", "true", "1", "yes")
-                        if isinstance(value, (int, float)):
-                            return bool(value)
-        return None
+        return coerce_bool(self._setting_value(self._setting_name))
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         try:
-            response = await self._api.set_setting(
-                self._device["id"],
-                self._setting_name,
-                True,
-            )
+            response = await self._async_set_setting(True)
             _LOGGER.debug(
                 "Turn on %s response for device %s: %s",
                 self._setting_name,
-                self._device["id"],
+                self._device_id,
                 response,
             )
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
         except QvantumApiError as err:
             _LOGGER.error(
                 "Failed to turn on %s: %s",
@@ -230,19 +313,13 @@ class QvantumSwitchEntity(QvantumEntity, SwitchEntity):  # pylint: disable=abstr
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         try:
-            response = await self._api.set_setting(
-                self._device["id"],
-                self._setting_name,
-                False,
-            )
+            response = await self._async_set_setting(False)
             _LOGGER.debug(
                 "Turn off %s response for device %s: %s",
                 self._setting_name,
-                self._device["id"],
+                self._device_id,
                 response,
             )
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
         except QvantumApiError as err:
             _LOGGER.error(
                 "Failed to turn off %s: %s",
@@ -255,8 +332,17 @@ class QvantumSwitchEntity(QvantumEntity, SwitchEntity):  # pylint: disable=abstr
             ) from err
 
 
-class QvantumExtraHotWaterSwitch(QvantumEntity, SwitchEntity):  # pylint: disable=abstract-method
-    """Switch entity for extra hot water control."""
+class QvantumExtraHotWaterSwitch(QvantumSettingSwitch):
+    """Switch entity for extra hot water control.
+
+    State is read from the ``extra_tap_water`` setting, while writes go
+    through the dedicated extra hot water command API.
+    """
+
+    __slots__ = ()
+
+    _attr_translation_key = "extra_hot_water"
+    _attr_icon = "mdi:water-boiler"
 
     def __init__(
         self,
@@ -265,80 +351,54 @@ class QvantumExtraHotWaterSwitch(QvantumEntity, SwitchEntity):  # pylint: disabl
         api: Any,
     ) -> None:
         """Initialize the switch entity."""
-        super().__init__(coordinator, device, api)
-        self._attr_translation_key = "extra_hot_water"
-        self._attr_unique_id = f"{device['id']}_extra_hot_water"
-        self._attr_icon = "mdi:water-boiler"
-        # _pending_state: set immediately after issuing a command to avoid a
-        # one-cycle flicker while the coordinator hasn't refreshed yet.  It is
-        # cleared on the very next coordinator update so that external changes
-        # (e.g. boost cancelled from the app or another HA session) are
-        # reflected after at most one polling interval.
-        self._pending_state: bool | None = None
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Clear pending command state on each coordinator refresh.
-
-        Once the coordinator has fetched fresh data from the API the pending
-        state is no longer needed — the real device state is now available.
-        """
-        self._pending_state = None
-        super()._handle_coordinator_update()
+        super().__init__(coordinator, device, api, "extra_tap_water")
+        self._attr_unique_id = f"{self._device_id}_extra_hot_water"
 
     @property
     def is_on(self) -> bool | None:
         """Return true if extra hot water is active.
 
-        Priority order:
-        1. ``_pending_state`` — set immediately after a command to cover the
-           one coordinator-cycle lag before the API reflects the new state.
-           Cleared on the next coordinator refresh.
-        2. ``extra_tap_water`` from the settings API — the canonical source.
-           Reliably reflects state when using the ``set_additional_hot_water``
-           command API (as opposed to the legacy ``update_settings`` path).
-        4. ``None`` (unknown) if no source has information yet.
+        ``extra_tap_water`` from the settings API is the canonical source.
+        It reliably reflects state when using the ``set_additional_hot_water``
+        command API (as opposed to the legacy ``update_settings`` path). After
+        a successful command the commanded value is cached until the
+        follow-up refresh reports the device's value.
         """
-        # Source 1 – transient command state (covers one coordinator cycle)
-        if self._pending_state is not None:
-            return self._pending_state
-
-        if self.coordinator.data:
-            # Source 2 – settings API (reliable with set_additional_hot_water)
-            for setting in self.coordinator.data.get("settings", {}).get(
-                "settings", []
-            ):
-                if setting["name"] == "extra_tap_water":
-                    value = setting.get("value")
-                    if isinstance(value, bool):
-                        return value
-                    if isinstance(value, str):
-                        return value.lower() in ("on", "true", "1", "yes")
-                    if isinstance(value, (int, float)):
-                        return bool(value)
-                    break
-
-        return None
+        return coerce_bool(self._setting_value(self._setting_name))
+
+    async def _async_write_value(self, value: Any) -> dict[str, Any]:
+        """Start indefinite extra hot water, or cancel it."""
+        if value:
+            return await self._api.set_extra_hot_water(
+                self._device_id,
+                indefinite=True,
+            )
+        return await self._api.set_extra_hot_water(
+            self._device_id,
+            hours=0,
+        )
+
+    def _write_accepted(self, response: dict[str, Any] | None) -> bool:
+        """Treat any command that did not raise as accepted.
+
+        The extra hot water command API does not report an APPLIED status,
+        so the commanded state is shown until the refresh confirms it.
+        """
+        return True
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on extra hot water indefinitely via the command API."""
         try:
-            response = await self._api.set_extra_hot_water(
-                self._device["id"],
-                indefinite=True,
-            )
+            response = await self._async_set_setting(True)
             _LOGGER.debug(
                 "Turn on extra hot water (indefinite) response for device %s: %s",
-                self._device["id"],
+                self._device_id,
                 response,
             )
-            _LOGGER.info(
+            _LOGGER.debug(
                 "Activated extra hot water indefinitely on device %s",
-                self._device["id"],
+                self._device_id,
             )
-            self._pending_state = True
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
         except QvantumApiError as err:
             _LOGGER.error(
                 "Failed to activate extra hot water: %s",
@@ -352,22 +412,16 @@ class QvantumExtraHotWaterSwitch(QvantumEntity, SwitchEntity):  # pylint: disabl
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Cancel extra hot water via the command API."""
         try:
-            response = await self._api.set_extra_hot_water(
-                self._device["id"],
-                hours=0,
-            )
+            response = await self._async_set_setting(False)
             _LOGGER.debug(
                 "Cancel extra hot water response for device %s: %s",
-                self._device["id"],
+                self._device_id,
                 response,
             )
-            _LOGGER.info(
+            _LOGGER.debug(
                 "Cancelled extra hot water on device %s",
-                self._device["id"],
+                self._device_id,
             )
-            self._pending_state = False
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
         except QvantumApiError as err:
             _LOGGER.error(
                 "Failed to cancel extra hot water: %s",
@@ -379,9 +433,20 @@ class QvantumExtraHotWaterSwitch(QvantumEntity, SwitchEntity):  # pylint: disabl
             ) from err
 
 
-class QvantumSmartControlSwitch(QvantumEntity, SwitchEntity):  # pylint: disable=abstract-method
+class QvantumSmartControlSwitch(QvantumSettingSwitch):
     """Switch entity for SmartControl enable/disable."""
 
+    __slots__ = ("_adaptive_enabled",)
+
+    # Map setting names to translation keys
+    _TRANSLATION_KEYS: ClassVar[dict[str, str]] = {
+        "enable_sc_sh": "smart_control_heating",
+        "enable_sc_dhw": "smart_control_dhw",
+    }
+
+    _attr_icon = "mdi:leaf"
+    _attr_entity_category = EntityCategory.CONFIG
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
@@ -390,22 +455,15 @@ class QvantumSmartControlSwitch(QvantumEntity, SwitchEntity):  # pylint: disable
         setting_name: str,
     ) -> None:
         """Initialize the switch entity."""
-        super().__init__(coordinator, device, api)
-        self._setting_name = setting_name
-        # Map setting names to translation keys
-        translation_key_map = {
-            "enable_sc_sh": "smart_control_heating",
-            "enable_sc_dhw": "smart_control_dhw",
-        }
-        translation_key = translation_key_map.get(setting_name, setting_name)
+        super().__init__(coordinator, device, api, setting_name)
+        translation_key = self._TRANSLATION_KEYS.get(setting_name, setting_name)
         self._attr_translation_key = translation_key
-        self._attr_unique_id = f"{device['id']}_{setting_name}"
-        self._attr_icon = "mdi:leaf"
-        self._attr_entity_category = EntityCategory.CONFIG
+        self._attr_unique_id = f"{self._device_id}_{setting_name}"
         _def = get_entity_def(translation_key)
         self._attr_entity_registry_enabled_default = (
             _def.enabled_by_default if _def else True
         )
+        self._adaptive_enabled = False
 
     @property
     def is_on(self) -> bool | None:
@@ -413,45 +471,18 @@ class QvantumSmartControlSwitch(QvantumEntity, SwitchEntity):  # pylint: disable
         if not self.coordinator.data:
             return False
 
-        # Try internal_metrics first (data is already extracted from 'values')
-        internal_metrics = self.coordinator.data.get("internal_metrics", {})
-        value = internal_metrics.get(self._setting_name)
-        if value is not None:
-            return bool(value)
-
-        # Fall back to settings
-        if (
-            "settings" in self.coordinator.data
-            and "settings" in self.coordinator.data["settings"]
-        ):
-            for setting in self.coordinator.data["settings"]["settings"]:
-                if setting["name"] == self._setting_name:
-                    value = setting.get("value")
-                    if value is not None:
-                        # Handle different value representations
-                        if isinstance(value, bool):
-                            return value
-                        if isinstance(value, str):
-                            return value.lower() in ("on", "true", "1", "yes")
-                        if isinstance(value, (int, float)):
-                            return bool(value)
-        return None
+        # Try internal_metrics first, falling back to settings
+        return coerce_bool(self._metric_or_setting_value(self._setting_name))
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         try:
-            await self._api.set_setting(
-                self._device["id"],
-                self._setting_name,
-                True,
-            )
-            _LOGGER.info(
+            await self._async_set_setting(True)
+            _LOGGER.debug(
                 "Turned on %s for device %s",
                 self._setting_name,
-                self._device["id"],
+                self._device_id,
             )
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
         except QvantumApiError as err:
             _LOGGER.error(
                 "Failed to turn on %s: %s",
@@ -466,18 +497,12 @@ class QvantumSmartControlSwitch(QvantumEntity, SwitchEntity):  # pylint: disable
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         try:
-            await self._api.set_setting(
-                self._device["id"],
-                self._setting_name,
-                False,
-            )
-            _LOGGER.info(
+            await self._async_set_setting(False)
+            _LOGGER.debug(
                 "Turned off %s for device %s",
                 self._setting_name,
-                self._device["id"],
+                self._device_id,
             )
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
         except QvantumApiError as err:
             _LOGGER.error(
                 "Failed to turn off %s: %s",
@@ -489,56 +514,39 @@ class QvantumSmartControlSwitch(QvantumEntity, SwitchEntity):  # pylint: disable
                 translation_key="set_value_failed",
             ) from err
 
+    def _refresh_cached_state(self) -> None:
+        """Recompute the SmartControl gate."""
+        # Only available when use_adaptive is explicitly True (i.e., when
+        # select.smartcontrol is not "Off"); check internal_metrics first,
+        # falling back to settings
+        self._adaptive_enabled = (
+            coerce_bool(self._metric_or_setting_value("use_adaptive")) is True
+        )
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if not self.coordinator.last_update_success:
+        # Check update success and connectivity first; a disconnected
+        # device is unavailable whatever the SmartControl state
+        if not super().available:
             return False
 
-        if not self.coordinator.data:
-            return False
+        return self._adaptive_enabled
 
-        # Only available when use_adaptive (SmartControl) is enabled
-        use_adaptive = None
-
-        # Check internal_metrics first
-        internal_metrics = self.coordinator.data.get("internal_metrics", {})
-        if internal_metrics:
-            use_adaptive = internal_metrics.get("use_adaptive")
-
-        # Fall back to settings if not found
-        if use_adaptive is None:
-            settings = self.coordinator.data.get("settings", {})
-            if "settings" in settings:
-                for setting in settings["settings"]:
-                    if setting.get("name") == "use_adaptive":
-                        use_adaptive = setting.get("value")
-                        break
-
-        # Convert to boolean if needed
-        if isinstance(use_adaptive, str):
-            use_adaptive = use_adaptive.lower() in ("on", "true", "1", "yes")
-        elif isinstance(use_adaptive, (int, float)):
-            use_adaptive = bool(use_adaptive)
-
-        # Only available when use_adaptive is explicitly True
-        # (i.e., when select.smartcontrol is not "Off")
-        if use_adaptive is not True:
-            return False
 
-        # Also check connectivity status
-        if (
-            "status" in self.coordinator.data
-            and "connectivity" in self.coordinator.data["status"]
-        ):
-            connectivity = self.coordinator.data["status"]["connectivity"]
-            return connectivity.get("connected", False)
+class QvantumManualOperationSwitch(QvantumSettingSwitch):
+    """Switch entity for Manual Operation Mode controls."""
 
-        return True
+    __slots__ = ("_op_mode_is_manual",)
 
+    # Map setting names to translation keys
+    _TRANSLATION_KEYS: ClassVar[dict[str, str]] = {
+        "op_man_dhw": "manual_dhw",
+        "op_man_addition": "manual_additional_heat",
+        "op_man_cooling": "manual_cooling",
+    }
 
-class QvantumManualOperationSwitch(QvantumEntity, SwitchEntity):  # pylint: disable=abstract-method
-    """Switch entity for Manual Operation Mode controls."""
+    _attr_entity_category = EntityCategory.CONFIG
 
     def __init__(
         self,
@@ -549,23 +557,16 @@ class QvantumManualOperationSwitch(QvantumEntity, SwitchEntity):  # pylint: disa
         icon: str,
     ) -> None:
         """Initialize the switch entity."""
-        super().__init__(coordinator, device, api)
-        self._setting_name = setting_name
-        # Map setting names to translation keys
-        translation_key_map = {
-            "op_man_dhw": "manual_dhw",
-            "op_man_addition": "manual_additional_heat",
-            "op_man_cooling": "manual_cooling",
-        }
-        translation_key = translation_key_map.get(setting_name, setting_name)
+        super().__init__(coordinator, device, api, setting_name)
+        translation_key = self._TRANSLATION_KEYS.get(setting_name, setting_name)
         self._attr_translation_key = translation_key
-        self._attr_unique_id = f"{device['id']}_{setting_name}"
+        self._attr_unique_id = f"{self._device_id}_{setting_name}"
         self._attr_icon = icon
-        self._attr_entity_category = EntityCategory.CONFIG
         _def = get_entity_def(translation_key)
         self._attr_entity_registry_enabled_default = (
             _def.enabled_by_default if _def else True
         )
+        self._op_mode_is_manual = False
 
     @property
     def is_on(self) -> bool | None:
@@ -574,45 +575,23 @@ class QvantumManualOperationSwitch(QvantumEntity, SwitchEntity):  # pylint: disa
             return False
 
         # Try internal_metrics first (data is already extracted from 'values')
-        internal_metrics = self.coordinator.data.get("internal_metrics", {})
-        value = internal_metrics.get(self._setting_name)
+        value = self._metric_value(self._setting_name)
         if value is not None:
             # Manual operation mode values are 0/1 integers
             return value == 1 or value is True
 
         # Fall back to settings
-        if (
-            "settings" in self.coordinator.data
-            and "settings" in self.coordinator.data["settings"]
-        ):
-            for setting in self.coordinator.data["settings"]["settings"]:
-                if setting["name"] == self._setting_name:
-                    value = setting.get("value")
-                    if value is not None:
-                        # Handle different value representations
-                        if isinstance(value, bool):
-                            return value
-                        if isinstance(value, str):
-                            return value.lower() in ("on", "true", "1", "yes")
-                        if isinstance(value, (int, float)):
-                            return value == 1 or bool(value)
-        return None
+        return coerce_bool(self._setting_value(self._setting_name))
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         try:
-            await self._api.set_setting(
-                self._device["id"],
-                self._setting_name,
-                1,
-            )
-            _LOGGER.info(
+            await self._async_set_setting(1)
+            _LOGGER.debug(
                 "Turned on %s for device %s",
                 self._setting_name,
-                self._device["id"],
+                self._device_id,
             )
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
         except QvantumApiError as err:
             _LOGGER.error(
                 "Failed to turn on %s: %s",
@@ -627,18 +606,12 @@ class QvantumManualOperationSwitch(QvantumEntity, SwitchEntity):  # pylint: disa
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         try:
-            await self._api.set_setting(
-                self._device["id"],
-                self._setting_name,
-                0,
-            )
-            _LOGGER.info(
+            await self._async_set_setting(0)
+            _LOGGER.debug(
                 "Turned off %s for device %s",
                 self._setting_name,
-                self._device["id"],
+                self._device_id,
             )
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
         except QvantumApiError as err:
             _LOGGER.error(
                 "Failed to turn off %s: %s",
@@ -666,53 +639,39 @@ class QvantumManualOperationSwitch(QvantumEntity, SwitchEntity):  # pylint: disa
             if not connectivity.get("connected", False):
                 return False
 
-            # For manual operation sub-switches, only available when operation mode is Manual (value 1)
-            if self._setting_name in (
-                "op_man_dhw",
-                "op_man_addition",
-                "op_man_cooling",
-            ):
-                op_mode_value = None
-
-                # Check internal_metrics first
-                internal_metrics = self.coordinator.data.get("internal_metrics", {})
-                if internal_metrics:
-                    op_mode_value = internal_metrics.get("op_mode")
-
-                # Fall back to settings if not found
-                if op_mode_value is None:
-                    settings = self.coordinator.data.get("settings", {})
-                    if "settings" in settings:
-                        for setting in settings["settings"]:
-                            if setting.get("name") == "op_mode":
-                                op_mode_value = setting.get("value")
-                                break
-
-                # Convert to integer if needed
-                if isinstance(op_mode_value, str):
-                    try:
-                        op_mode_value = int(op_mode_value)
-                    except (ValueError, TypeError):
-                        op_mode_value = (
-                            1
-                            if op_mode_value.lower() in ("on", "true", "1", "yes")
-                            else 0
-                        )
-                elif isinstance(op_mode_value, bool):
-                    op_mode_value = 1 if op_mode_value else 0
-
-                # Only available when op_mode is 1 (enabled)
-                if op_mode_value != 1:
-                    return False
+            return self._op_mode_is_manual
+
+        return True
 
+    def _refresh_cached_state(self) -> None:
+        """Recompute the operation mode gate."""
+        self._op_mode_is_manual = self._compute_op_mode_is_manual()
+
+    def _compute_op_mode_is_manual(self) -> bool:
+        """Return whether the operation mode allows manual sub-switch changes."""
+        # For manual operation sub-switches, only available when operation mode is Manual (value 1)
+        if self._setting_name not in (
+            "op_man_dhw",
+            "op_man_addition",
+            "op_man_cooling",
+        ):
             return True
 
-        return True
+        # Only available when op_mode is 1 (enabled); the coordinator
+        # normalizes op_mode to int at ingest. Check internal_metrics first,
+        # falling back to settings
+        return self._metric_or_setting_value("op_mode") == 1
 
 
 class QvantumAutoElevateAccessSwitch(QvantumEntity, SwitchEntity):  # pylint: disable=abstract-method
     """Switch to control automatic access elevation renewal."""
 
+    __slots__ = ()
+
+    _attr_translation_key = "auto_elevate_access"
+    _attr_icon = "mdi:shield-refresh"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
     def __init__(
         self,
         coordinator: QvantumDataUpdateCoordinator,
@@ -721,10 +680,7 @@ class QvantumAutoElevateAccessSwitch(QvantumEntity, SwitchEntity):  # pylint: di
     ) -> None:
         """Initialize the switch entity."""
         super().__init__(coordinator, device, api)
-        self._attr_translation_key = "auto_elevate_access"
-        self._attr_unique_id = f"{device['id']}_auto_elevate_access"
-        self._attr_icon = "mdi:shield-refresh"
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_unique_id = f"{self._device_id}_auto_elevate_access"
 
     @property
     def is_on(self) -> bool:
@@ -735,14 +691,19 @@ class QvantumAutoElevateAccessSwitch(QvantumEntity, SwitchEntity):  # pylint: di
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable automatic access elevation renewal."""
         await self.coordinator.async_set_auto_elevate(True)
-        _LOGGER.info("Auto-elevate access enabled for device %s", self._device["id"])
+        _LOGGER.debug("Auto-elevate access enabled for device %s", self._device_id)
         # Immediately elevate access when enabled
         try:
-            await self._api.elevate_access(
-                self._device["id"],
+            new_access = await self._api.elevate_access(
+                self._device_id,
             )
-            _LOGGER.info("Access elevated successfully")
-            await self.coordinator.async_request_refresh()
+            _LOGGER.debug("Access elevated successfully")
+            # This switch's own state is a local flag, so there is nothing to
+            # poll for; publish the new access level from the response instead
+            data = self.coordinator.data
+            if new_access and data:
+                data["access_level"] = new_access
+                self.coordinator.async_set_updated_data(data)
         except QvantumApiError as err:
             _LOGGER.warning("Failed to elevate access: %s", err)
         self.async_write_ha_state()
@@ -750,5 +711,5 @@ class QvantumAutoElevateAccessSwitch(QvantumEntity, SwitchEntity):  # pylint: di
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable automatic access elevation renewal."""
         await self.coordinator.async_set_auto_elevate(False)
-        _LOGGER.info("Auto-elevate access disabled for device %s", self._device["id"])
+        _LOGGER.debug("Auto-elevate access disabled for device %s", self._device_id)
         self.async_write_ha_state()
@@ -136,6 +136,7 @@ def mock_api():
 
     # Settings / command writes
     api.set_setting = AsyncMock(return_value={"response": {}})
+    api.set_settings = AsyncMock(return_value={"response": {}})
     api.set_extra_hot_water = AsyncMock(return_value={"success": True})
     api.set_smartcontrol = AsyncMock(return_value={"success": True})
     api.elevate_access = AsyncMock(
@@ -139,6 +139,7 @@ MOCK_INTERNAL_METRICS_RESPONSE = {
         "enable_sc_sh": False,
         "enable_sc_dhw": False,
         "use_adaptive": False,
+        "smart_sh_mode": 0,
     }
 }
 
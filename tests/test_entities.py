@@ -13,10 +13,16 @@ from unittest.mock import patch
 import pytest
 
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 
+from custom_components.qvantum_hass.api import QvantumApiError
 from custom_components.qvantum_hass.const import DOMAIN
-from tests.fixtures import MOCK_ALARMS_ACTIVE_RESPONSE, MOCK_INTERNAL_METRICS_RESPONSE
+from tests.fixtures import (
+    MOCK_ALARMS_ACTIVE_RESPONSE,
+    MOCK_INTERNAL_METRICS_RESPONSE,
+    MOCK_STATUS_RESPONSE,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -79,6 +85,34 @@ async def test_fast_polling_metric_sensor_state(
     assert float(state.state) == pytest.approx(expected)
 
 
+async def test_metric_sensor_not_created_for_unreported_metric(
+    hass: HomeAssistant, mock_config_entry, mock_api
+) -> None:
+    """No sensor is created for a metric missing from the internal metrics."""
+    assert "bt2" not in MOCK_INTERNAL_METRICS_RESPONSE["values"]
+
+    entity_registry = await _setup(hass, mock_api)
+
+    assert (
+        entity_registry.async_get_entity_id("sensor", DOMAIN, "device_123_internal_bt2")
+        is None
+    )
+
+
+async def test_metric_sensors_created_when_metrics_are_empty(
+    hass: HomeAssistant, mock_config_entry, mock_api
+) -> None:
+    """An empty metrics fetch leaves capabilities unknown, so sensors exist."""
+    mock_api.get_internal_metrics.return_value = {"values": {}}
+
+    entity_registry = await _setup(hass, mock_api)
+
+    assert (
+        entity_registry.async_get_entity_id("sensor", DOMAIN, "device_123_internal_bt2")
+        is not None
+    )
+
+
 # ---------------------------------------------------------------------------
 # Binary sensor entities (source: internal_metrics)
 # ---------------------------------------------------------------------------
@@ -163,6 +197,72 @@ async def test_alarm_state_sensor_is_on_with_active_alarm(
     assert state.state == "on"
 
 
+async def test_alarm_count_sensor_counts_active_alarms(
+    hass: HomeAssistant, mock_config_entry, mock_api
+) -> None:
+    """alarm_count sensor reports the active alarm count and alarm totals."""
+    mock_api.get_alarms.return_value = MOCK_ALARMS_ACTIVE_RESPONSE
+
+    entity_registry = await _setup(hass, mock_api)
+
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, "device_123_alarm_count"
+    )
+    assert entity_id is not None
+
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == "1"
+    assert state.attributes["total_alarms"] == 1
+    assert state.attributes["acknowledged_alarms"] == 0
+
+
+async def test_access_sensors_reflect_access_level_data(
+    hass: HomeAssistant, mock_config_entry, mock_api
+) -> None:
+    """access_level shows the write level; access_expires_at is unavailable without expiry."""
+    entity_registry = await _setup(hass, mock_api)
+
+    level_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, "device_123_access_level"
+    )
+    expires_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, "device_123_access_expires_at"
+    )
+    assert level_id is not None
+    assert expires_id is not None
+
+    level_state = hass.states.get(level_id)
+    assert level_state.state == "10"
+    assert level_state.attributes["has_service_access"] is False
+    # MOCK_ACCESS_LEVEL_RESPONSE["expiresAt"] is None
+    assert hass.states.get(expires_id).state == "unavailable"
+
+
+async def test_metadata_sensor_not_created_for_unreported_key(
+    hass: HomeAssistant, mock_config_entry, mock_api
+) -> None:
+    """Metadata sensors are only created for keys present in device_metadata."""
+    mock_api.get_status.return_value = {
+        **MOCK_STATUS_RESPONSE,
+        "device_metadata": {"uptime_hours": 12},
+    }
+
+    entity_registry = await _setup(hass, mock_api)
+
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, "device_123_metadata_uptime_hours"
+    )
+    assert entity_id is not None
+    assert hass.states.get(entity_id).state == "12"
+    assert (
+        entity_registry.async_get_entity_id(
+            "sensor", DOMAIN, "device_123_metadata_cc_fw_version"
+        )
+        is None
+    )
+
+
 # ---------------------------------------------------------------------------
 # Switch entity state and actions
 # ---------------------------------------------------------------------------
@@ -233,6 +333,79 @@ async def test_switch_turn_off_calls_set_setting(
     mock_api.set_setting.assert_called_with("device_123", "vacation_mode", False)
 
 
+async def test_switch_write_is_optimistic_only_when_applied(
+    hass: HomeAssistant, mock_config_entry, mock_api
+) -> None:
+    """An applied write shows at once; other outcomes leave the cache alone."""
+    entity_registry = await _setup(hass, mock_api)
+    coordinator = mock_config_entry.runtime_data["coordinators"]["device_123"]
+
+    entity_id = entity_registry.async_get_entity_id(
+        "switch", DOMAIN, "device_123_vacation_mode"
+    )
+    assert entity_id is not None
+
+    # Not applied: nothing is written to the cached settings
+    await hass.services.async_call(
+        "switch", "turn_on", {"entity_id": entity_id}, blocking=True
+    )
+    assert "vacation_mode" not in coordinator.data["settings_by_name"]
+
+    mock_api.set_setting.return_value = {"status": "APPLIED"}
+    await hass.services.async_call(
+        "switch", "turn_on", {"entity_id": entity_id}, blocking=True
+    )
+    assert hass.states.get(entity_id).state == "on"
+
+    mock_api.set_setting.side_effect = QvantumApiError("Write failed")
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            "switch", "turn_off", {"entity_id": entity_id}, blocking=True
+        )
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).state == "on"
+
+
+async def test_extra_hot_water_switch_shows_commanded_state(
+    hass: HomeAssistant, mock_config_entry, mock_api
+) -> None:
+    """The extra hot water switch flips at once on a successful command."""
+    # mock_api.set_extra_hot_water returns {"success": True}, with no status
+    entity_registry = await _setup(hass, mock_api)
+
+    entity_id = entity_registry.async_get_entity_id(
+        "switch", DOMAIN, "device_123_extra_hot_water"
+    )
+    assert entity_id is not None
+
+    await hass.services.async_call(
+        "switch", "turn_on", {"entity_id": entity_id}, blocking=True
+    )
+    mock_api.set_extra_hot_water.assert_called_with("device_123", indefinite=True)
+    assert hass.states.get(entity_id).state == "on"
+
+    await hass.services.async_call(
+        "switch", "turn_off", {"entity_id": entity_id}, blocking=True
+    )
+    mock_api.set_extra_hot_water.assert_called_with("device_123", hours=0)
+    assert hass.states.get(entity_id).state == "off"
+
+
+async def test_smart_control_switch_unavailable_when_adaptive_disabled(
+    hass: HomeAssistant, mock_config_entry, mock_api
+) -> None:
+    """SmartControl switches are unavailable while use_adaptive is off."""
+    # MOCK_INTERNAL_METRICS_RESPONSE["values"]["use_adaptive"] = False
+    entity_registry = await _setup(hass, mock_api)
+
+    entity_id = entity_registry.async_get_entity_id(
+        "switch", DOMAIN, "device_123_enable_sc_sh"
+    )
+    assert entity_id is not None
+    assert hass.states.get(entity_id).state == "unavailable"
+
+
 # ---------------------------------------------------------------------------
 # Select entity state and actions
 # ---------------------------------------------------------------------------
@@ -276,6 +449,146 @@ async def test_select_option_calls_set_smartcontrol(
     mock_api.set_smartcontrol.assert_called_once_with("device_123", 0, 0)
 
 
+async def test_smartcontrol_select_is_optimistic_when_applied(
+    hass: HomeAssistant, mock_config_entry, mock_api
+) -> None:
+    """An applied SmartControl change shows before the refresh lands."""
+    mock_api.set_smartcontrol.return_value = {"status": "APPLIED"}
+    entity_registry = await _setup(hass, mock_api)
+
+    entity_id = entity_registry.async_get_entity_id(
+        "select", DOMAIN, "device_123_smartcontrol"
+    )
+    assert entity_id is not None
+
+    await hass.services.async_call(
+        "select",
+        "select_option",
+        {"entity_id": entity_id, "option": "eco"},
+        blocking=True,
+    )
+
+    assert hass.states.get(entity_id).state == "eco"
+
+
+async def test_select_current_option_skips_api_call(
+    hass: HomeAssistant, mock_config_entry, mock_api
+) -> None:
+    """Re-selecting the current SmartControl option does not call the API."""
+    # MOCK_INTERNAL_METRICS_RESPONSE has use_adaptive = False, so "off" is current
+    entity_registry = await _setup(hass, mock_api)
+
+    entity_id = entity_registry.async_get_entity_id(
+        "select", DOMAIN, "device_123_smartcontrol"
+    )
+    assert entity_id is not None
+
+    await hass.services.async_call(
+        "select",
+        "select_option",
+        {"entity_id": entity_id, "option": "off"},
+        blocking=True,
+    )
+
+    mock_api.set_smartcontrol.assert_not_called()
+
+
+async def test_select_not_created_for_unreported_value(
+    hass: HomeAssistant, mock_config_entry, mock_api
+) -> None:
+    """No DHW priority select is created when the device does not report it."""
+    # Neither MOCK_INTERNAL_METRICS_RESPONSE nor MOCK_SETTINGS_RESPONSE has
+    # dhw_prioritytime
+    entity_registry = await _setup(hass, mock_api)
+
+    assert (
+        entity_registry.async_get_entity_id(
+            "select", DOMAIN, "device_123_dhw_priority"
+        )
+        is None
+    )
+
+
+async def test_selects_created_when_settings_index_is_empty(
+    hass: HomeAssistant, mock_config_entry, mock_api
+) -> None:
+    """An empty settings fetch leaves capabilities unknown, so selects exist."""
+    mock_api.get_settings.return_value = {"settings": []}
+
+    entity_registry = await _setup(hass, mock_api)
+
+    coordinator = mock_config_entry.runtime_data["coordinators"]["device_123"]
+    assert coordinator.data["settings_by_name"] == {}
+    for unique_suffix in (
+        "indoor_temp_target",
+        "tap_water_capacity_target",
+        "curve_shift",
+        "sensor_mode",
+    ):
+        assert (
+            entity_registry.async_get_entity_id(
+                "select", DOMAIN, f"device_123_{unique_suffix}"
+            )
+            is not None
+        )
+
+
+async def test_indoor_temperature_target_select_truncates_fractional_value(
+    hass: HomeAssistant, mock_config_entry, mock_api
+) -> None:
+    """A fractional indoor temperature target selects the whole-degree option."""
+    mock_api.get_settings.return_value = {
+        "settings": [{"name": "indoor_temperature_target", "value": 21.5}]
+    }
+
+    entity_registry = await _setup(hass, mock_api)
+
+    entity_id = entity_registry.async_get_entity_id(
+        "select", DOMAIN, "device_123_indoor_temp_target"
+    )
+    assert entity_id is not None
+    assert hass.states.get(entity_id).state == "temp_21c"
+
+
+async def test_dhw_priority_select_custom_value_cleared_once_applied(
+    hass: HomeAssistant, mock_config_entry, mock_api
+) -> None:
+    """A custom DHW priority stays selected until a standard value is applied."""
+    mock_api.get_internal_metrics.return_value = {
+        "values": {**MOCK_INTERNAL_METRICS_RESPONSE["values"], "dhw_prioritytime": 45}
+    }
+    entity_registry = await _setup(hass, mock_api)
+
+    entity_id = entity_registry.async_get_entity_id(
+        "select", DOMAIN, "device_123_dhw_priority"
+    )
+    assert entity_id is not None
+    custom_label = "Custom (45 minutes)"
+    assert hass.states.get(entity_id).state == custom_label
+
+    # Not applied: the custom option is kept and still selected
+    await hass.services.async_call(
+        "select",
+        "select_option",
+        {"entity_id": entity_id, "option": "plus_1h"},
+        blocking=True,
+    )
+    state = hass.states.get(entity_id)
+    assert state.state == custom_label
+    assert custom_label in state.attributes["options"]
+
+    mock_api.set_setting.return_value = {"status": "APPLIED"}
+    await hass.services.async_call(
+        "select",
+        "select_option",
+        {"entity_id": entity_id, "option": "plus_1h"},
+        blocking=True,
+    )
+    state = hass.states.get(entity_id)
+    assert state.state == "plus_1h"
+    assert custom_label not in state.attributes["options"]
+
+
 # ---------------------------------------------------------------------------
 # Number entity actions
 # ---------------------------------------------------------------------------
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import patch
 
 from homeassistant.config_entries import ConfigEntryState
@@ -93,6 +94,129 @@ async def test_coordinator_updates_data(
         assert "settings" in coordinator.data
 
 
+async def test_coordinator_indexes_settings_by_name(
+    hass: HomeAssistant, mock_config_entry, mock_api
+):
+    """Test that the coordinator exposes settings values keyed by name."""
+    with patch(
+        "custom_components.qvantum_hass.QvantumApi",
+        return_value=mock_api,
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = mock_config_entry.runtime_data["coordinators"]["device_123"]
+        assert coordinator.data["settings_by_name"] == {
+            "target_temperature": 22.0,
+            "operating_mode": "heat",
+        }
+
+
+async def test_coordinator_normalizes_metric_values(
+    hass: HomeAssistant, mock_config_entry, mock_api
+):
+    """Test that mixed-representation values are normalized at ingest."""
+    mock_api.get_internal_metrics.return_value = {
+        "values": {
+            "use_adaptive": "on",
+            "op_mode": "1",
+            "dhw_outl_temp_5": 55.0,
+            "hp_status": "3",
+        }
+    }
+    mock_api.get_settings.return_value = {
+        "settings": [
+            {"name": "use_adaptive", "value": 0},
+            {"name": "indoor_temperature_offset", "value": "-2"},
+        ]
+    }
+
+    with patch(
+        "custom_components.qvantum_hass.QvantumApi",
+        return_value=mock_api,
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = mock_config_entry.runtime_data["coordinators"]["device_123"]
+        assert coordinator.data["internal_metrics"]["use_adaptive"] is True
+        assert coordinator.data["settings_by_name"]["use_adaptive"] is False
+        assert coordinator.data["internal_metrics"]["op_mode"] == 1
+        assert coordinator.data["internal_metrics"]["dhw_outl_temp_5"] == 55
+        assert coordinator.data["internal_metrics"]["hp_status"] == 3
+        assert coordinator.data["settings_by_name"]["indoor_temperature_offset"] == -2
+
+
+async def test_coordinator_optimistic_value_updates_cached_data(
+    hass: HomeAssistant, mock_config_entry, mock_api
+):
+    """Test that an optimistic write updates both the settings and metric copies."""
+    mock_api.get_internal_metrics.return_value = {"values": {"dhw_prioritytime": 30}}
+
+    with patch(
+        "custom_components.qvantum_hass.QvantumApi",
+        return_value=mock_api,
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = mock_config_entry.runtime_data["coordinators"]["device_123"]
+        coordinator.async_set_optimistic_value("dhw_prioritytime", 60)
+
+        assert coordinator.data["settings_by_name"]["dhw_prioritytime"] == 60
+        assert coordinator.data["internal_metrics"]["dhw_prioritytime"] == 60
+
+
+async def test_coordinator_batches_setting_writes(
+    hass: HomeAssistant, mock_config_entry, mock_api
+):
+    """Test that writes scheduled together are sent as one command."""
+    with patch(
+        "custom_components.qvantum_hass.QvantumApi",
+        return_value=mock_api,
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = mock_config_entry.runtime_data["coordinators"]["device_123"]
+        await asyncio.gather(
+            coordinator.async_schedule_setting("vacation_mode", True),
+            coordinator.async_schedule_setting("op_man_dhw", 1),
+        )
+
+        mock_api.set_settings.assert_called_once_with(
+            "device_123", {"vacation_mode": True, "op_man_dhw": 1}
+        )
+        mock_api.set_setting.assert_not_called()
+
+
+async def test_unload_flushes_queued_setting_writes(
+    hass: HomeAssistant, mock_config_entry, mock_api
+):
+    """Test that a write queued just before unload is sent before close."""
+    with patch(
+        "custom_components.qvantum_hass.QvantumApi",
+        return_value=mock_api,
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = mock_config_entry.runtime_data["coordinators"]["device_123"]
+        write = hass.async_create_task(
+            coordinator.async_schedule_setting("vacation_mode", True)
+        )
+        await asyncio.sleep(0)
+
+        await hass.config_entries.async_unload(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert write.done()
+        mock_api.set_setting.assert_called_once_with(
+            "device_123", "vacation_mode", True
+        )
+        mock_api.close.assert_called_once()
+
+
 async def test_fast_coordinator_updates_metrics(
     hass: HomeAssistant, mock_config_entry, mock_api
 ):